@@ -1,110 +1,819 @@
+import threading
+from itertools import chain, repeat
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_first = itemgetter(0)
+_endpoints = itemgetter(0, 1)
+
+
+def _as_list(values):
+    # NumPy / array.array -> list of plain Python scalars in one C-level call
+    return values.tolist() if hasattr(values, 'tolist') else values
+
+
+def _numpy_labels(sources, targets):
+    # from_arrays() fast path: two NumPy arrays of the same (non-object) label kind
+    return (np is not None and isinstance(sources, np.ndarray) and isinstance(targets, np.ndarray)
+            and sources.dtype.kind == targets.dtype.kind and sources.dtype.kind != 'O')
+
+
+def _grouped(keys, count, values, weights):
+    # values (and weights) grouped by the dense int key, equal keys in input order.
+    # Sorting key * n + position gives that order without a slower stable argsort
+    n = len(keys)
+    order = np.sort(keys.astype(np.int64) * n + np.arange(n)) % n
+    bounds = [0] + np.cumsum(np.bincount(keys, minlength=count)).tolist()
+    return bounds, values[order].tolist(), None if weights is None else weights[order].tolist()
+
+
+def _rows_from_arrays(sources, targets, weights, directed, track_incoming):
+    """
+    Adjacency dicts for the edges sources[i] -> targets[i], built with NumPy.
+
+    Gives the same dicts as adding the edges one by one (first-seen vertex and
+    neighbor order, last weight of a repeated edge) but every per-edge step
+    runs in NumPy, only one dict(zip()) per vertex is left in Python.
+
+    Returns:
+        tuple: (adjacency, incoming), incoming is None unless directed and track_incoming
+    """
+    endpoints = np.stack([sources, targets], axis=1).ravel()
+    unique, ids = np.unique(endpoints, return_inverse=True)
+    count = len(unique)
+    first = np.full(count, len(endpoints))
+    np.minimum.at(first, ids, np.arange(len(endpoints)))
+    labels = unique.tolist()
+    vertex_order = np.argsort(first).tolist()
+
+    def rows(keys, values, row_weights):
+        bounds, values, row_weights = _grouped(keys, count, values, row_weights)
+        if row_weights is None:
+            return {labels[i]: dict.fromkeys(values[bounds[i]:bounds[i + 1]]) for i in vertex_order}
+        return {labels[i]: dict(zip(values[bounds[i]:bounds[i + 1]], row_weights[bounds[i]:bounds[i + 1]]))
+                for i in vertex_order}
+
+    if directed:
+        adjacency = rows(ids[0::2], targets, weights)
+        incoming = rows(ids[1::2], sources, weights) if track_incoming else None
+        return adjacency, incoming
+    # an undirected edge is stored from both ends, in edge order
+    both_weights = None if weights is None else np.repeat(weights, 2)
+    return rows(ids, np.stack([targets, sources], axis=1).ravel(), both_weights), None
+
+
+def iter_neighbors(graph, vertex):
+    """
+    Iterator over the neighbor vertices of vertex, without edge weights.
+
+    Whether graph.graph rows hold (neighbor, weight) pairs comes from the
+    graph's weighted flag, not from the entries themselves, so unweighted
+    graphs with tuple labels such as grid coordinates (r, c) work too.
+    """
+    row = graph.graph[vertex]
+    if getattr(graph, 'weighted', False):
+        return map(_first, row)
+    return iter(row)
+
+
 class WeightedGraph:
-    def __init__(self, directed=False):
+    # rows of self.graph are (neighbor, weight) pairs, see iter_neighbors()
+    weighted = True
+
+    def __init__(self, directed=False, track_incoming=False):
         self.graph = {}
         self.directed = directed
+        # neighbor -> weight dict per vertex. self.graph[vertex] is a live
+        # items() view of it, so algorithms still iterate (neighbor, weight)
+        # pairs in insertion order while add / update / lookup / remove are O(1)
+        self._adjacency = {}
+        # optional reverse index for directed graphs: vertex -> {predecessor: weight}.
+        # Undirected graphs don't need it, their adjacency is already symmetric
+        self.track_incoming = track_incoming
+        self._incoming = {} if directed and track_incoming else None
+        self._incoming_views = {}
+        # bumped on every change, drops the cached edge_array()
+        self.version = 0
+        self._edge_cache = None
+        # copy-on-write state for snapshot(): writers hold the lock, _shared means
+        # the top-level dicts still belong to the last snapshot and _owned holds
+        # the vertices whose neighbor dicts were copied / created since then
+        # (None until the first snapshot, so graphs that never snapshot pay nothing)
+        self._lock = threading.RLock()
+        self._shared = False
+        self._owned = None
+        self._snapshot = None
+        # callables told about every change, see add_listener()
+        self._listeners = []
+
+    def _changed(self):
+        self.version += 1
+        self._edge_cache = None
+
+    def add_listener(self, listener):
+        """
+        Call listener(event, vertex1, vertex2) after every change to the graph.
+
+        event is 'add_vertex', 'add_edge', 'remove_vertex' or 'remove_edge'
+        (vertex2 is None for the vertex events). add_edges_from() sends a
+        single 'add_edges' event instead, with the list of added edge tuples
+        as vertex1 (its new vertices get no 'add_vertex' events). Lets indexes
+        such as IncrementalComponents follow the graph instead of being rebuilt.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, event, vertex1, vertex2=None):
+        for listener in self._listeners:
+            listener(event, vertex1, vertex2)
+
+    def _start_batch(self, edges, endpoints):
+        # a snapshot may still share the neighbor dicts the batch writes to,
+        # copy them once up front so the edge loop can store into them directly
+        self._unshare()
+        if self._owned is not None:
+            adjacency = self._adjacency
+            for vertex in dict.fromkeys(chain.from_iterable(map(endpoints, edges))):
+                if vertex in adjacency:
+                    self._writable(vertex)
+
+    def _new_vertex(self, vertex):
+        # add_vertex() without locking, version bump or events, returns the neighbor dict
+        neighbors = self._adjacency[vertex] = {}
+        self.graph[vertex] = neighbors.items()
+        if self._owned is not None:
+            self._owned.add(vertex)
+        if self._incoming is not None:
+            self._incoming[vertex] = {}
+            self._incoming_views[vertex] = self._incoming[vertex].items()
+        return neighbors
+
+    def _finish_batch(self, edges):
+        self._changed()
+        if self._listeners:
+            self._notify('add_edges', edges)
+
+    def _load_rows(self, adjacency, incoming):
+        # install prebuilt neighbor dicts on an empty graph (from_arrays() fast path)
+        self._adjacency = adjacency
+        self.graph = {vertex: neighbors.items() if self.weighted else neighbors.keys()
+                      for vertex, neighbors in adjacency.items()}
+        if self._incoming is not None:
+            self._incoming = incoming
+            self._incoming_views = {vertex: predecessors.items() if self.weighted else predecessors.keys()
+                                    for vertex, predecessors in incoming.items()}
+        self._changed()
+
+    def _unshare(self):
+        # first write after a snapshot: stop sharing the top-level dicts with it
+        if self._shared:
+            self._adjacency = dict(self._adjacency)
+            self.graph = dict(self.graph)
+            self._shared = False
+
+    def _writable(self, vertex):
+        # neighbor dict of vertex that is safe to change in place
+        neighbors = self._adjacency[vertex]
+        if self._owned is not None and vertex not in self._owned:
+            neighbors = dict(neighbors)
+            self._adjacency[vertex] = neighbors
+            self.graph[vertex] = neighbors.items()
+            self._owned.add(vertex)
+        return neighbors
+
+    def snapshot(self):
+        """
+        Immutable, versioned view of the graph for concurrent readers, in O(1).
+
+        Nothing is copied here. Later writes copy the top-level dicts once and
+        each neighbor dict the first time they touch it, so the snapshot never
+        sees a half-applied change and dijkstra / bfs can run on it from other
+        threads while this graph keeps being updated.
+        """
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.version:
+                self._snapshot = GraphSnapshot(self.graph, self.directed, True, self.version, self._edge_cache)
+                self._shared = True
+                self._owned = set()
+            return self._snapshot
+
+    def _predecessor_dicts(self):
+        if not self.directed:
+            return self._adjacency
+        return self._incoming
 
     def add_vertex(self, vertex):
-        if vertex not in self.graph:
-            self.graph[vertex] = []
+        with self._lock:
+            if vertex not in self.graph:
+                self._unshare()
+                self._adjacency[vertex] = {}
+                self.graph[vertex] = self._adjacency[vertex].items()
+                if self._owned is not None:
+                    self._owned.add(vertex)
+                if self._incoming is not None:
+                    self._incoming[vertex] = {}
+                    self._incoming_views[vertex] = self._incoming[vertex].items()
+                self._changed()
+                if self._listeners:
+                    self._notify('add_vertex', vertex)
 
     def add_edge(self, vertex1, vertex2, weight=1):
-        self.add_vertex(vertex1)
-        self.add_vertex(vertex2)
+        with self._lock:
+            if vertex1 not in self.graph:
+                self.add_vertex(vertex1)
+            if vertex2 not in self.graph:
+                self.add_vertex(vertex2)
+            self._unshare()
 
-        for i, (v, w) in enumerate(self.graph[vertex1]):
-            if v == vertex2:
-                self.graph[vertex1][i] = (vertex2, weight)
-                break
-        else:
-            self.graph[vertex1].append((vertex2, weight))
+            # updating an existing key keeps its position, same as the old in-place replace
+            self._writable(vertex1)[vertex2] = weight
+            if not self.directed:
+                self._writable(vertex2)[vertex1] = weight
+            elif self._incoming is not None:
+                self._incoming[vertex2][vertex1] = weight
+            self._changed()
+            if self._listeners:
+                self._notify('add_edge', vertex1, vertex2)
 
-        if not self.directed:
-            for i, (v, w) in enumerate(self.graph[vertex2]):
-                if v == vertex1:
-                    self.graph[vertex2][i] = (vertex1, weight)
-                    break
+    def add_edges_from(self, edges):
+        """
+        Add an iterable of (vertex1, vertex2, weight) tuples in one O(E) pass.
+
+        Gives the same graph as calling add_edge() for each tuple: vertices and
+        neighbors keep first-seen order and a repeated edge keeps its last weight.
+        The loop only stores into the neighbor dicts, new vertices are created
+        when a store misses. The version is bumped and listeners are told once
+        per batch, with an 'add_edges' event carrying the edge list.
+        """
+        edges = edges if isinstance(edges, (list, tuple)) else list(edges)
+        with self._lock:
+            self._start_batch(edges, _endpoints)
+            adjacency = self._adjacency
+            new_vertex = self._new_vertex
+            # a failed store means a new vertex. vertex1 is created before
+            # vertex2, which keeps the first-seen vertex order of add_edge()
+            if not self.directed:
+                for vertex1, vertex2, weight in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = weight
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = weight
+                    try:
+                        adjacency[vertex2][vertex1] = weight
+                    except KeyError:
+                        new_vertex(vertex2)[vertex1] = weight
+            elif self._incoming is not None:
+                incoming = self._incoming
+                for vertex1, vertex2, weight in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = weight
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = weight
+                    if vertex2 not in adjacency:
+                        new_vertex(vertex2)
+                    incoming[vertex2][vertex1] = weight
             else:
-                self.graph[vertex2].append((vertex1, weight))
+                for vertex1, vertex2, weight in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = weight
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = weight
+                    if vertex2 not in adjacency:
+                        new_vertex(vertex2)
+            self._finish_batch(edges)
+
+    @classmethod
+    def from_edge_list(cls, edges, directed=False, track_incoming=False):
+        """Build a graph from an iterable of (vertex1, vertex2, weight) tuples."""
+        graph = cls(directed, track_incoming)
+        graph.add_edges_from(edges)
+        return graph
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights=None, directed=False, track_incoming=False):
+        """
+        Build a graph from parallel sequences, e.g. NumPy arrays.
+
+        Edge i is sources[i] -> targets[i] with weights[i] (1 when weights is None).
+        Two NumPy label arrays of the same kind take a vectorized path that
+        groups the edges per vertex in NumPy instead of adding them one by one.
+        """
+        if _numpy_labels(sources, targets):
+            graph = cls(directed, track_incoming)
+            weights = np.ones(len(sources), dtype=np.int64) if weights is None else np.asarray(weights)
+            graph._load_rows(*_rows_from_arrays(sources, targets, weights, directed, graph._incoming is not None))
+            return graph
+        sources, targets = _as_list(sources), _as_list(targets)
+        weights = repeat(1) if weights is None else _as_list(weights)
+        return cls.from_edge_list(zip(sources, targets, weights), directed, track_incoming)
 
     def remove_vertex(self, vertex):
-        if vertex in self.graph:
-            for v in self.graph:
-                self.graph[v] = [(n, w) for n, w in self.graph[v] if n != vertex]
-            del self.graph[vertex]
+        with self._lock:
+            if vertex in self.graph:
+                self._unshare()
+                predecessors = self._predecessor_dicts()
+                if predecessors is None:
+                    # no reverse index, every adjacency dict may point at vertex
+                    predecessors = [v for v, neighbors in self._adjacency.items() if vertex in neighbors]
+                else:
+                    # O(deg): only the vertices linked to vertex are touched
+                    predecessors = list(predecessors[vertex])
+                for predecessor in predecessors:
+                    self._writable(predecessor).pop(vertex, None)
+                if self._incoming is not None:
+                    for successor in self._adjacency[vertex]:
+                        self._incoming[successor].pop(vertex, None)
+                    del self._incoming[vertex]
+                    del self._incoming_views[vertex]
+                del self._adjacency[vertex]
+                del self.graph[vertex]
+                self._changed()
+                if self._listeners:
+                    self._notify('remove_vertex', vertex)
 
     def remove_edge(self, vertex1, vertex2):
-        if vertex1 in self.graph and vertex2 in self.graph:
-            self.graph[vertex1] = [(v, w) for v, w in self.graph[vertex1] if v != vertex2]
-            if not self.directed:
-                self.graph[vertex2] = [(v, w) for v, w in self.graph[vertex2] if v != vertex1]
+        with self._lock:
+            if vertex1 in self.graph and vertex2 in self.graph:
+                self._unshare()
+                self._writable(vertex1).pop(vertex2, None)
+                if not self.directed:
+                    self._writable(vertex2).pop(vertex1, None)
+                elif self._incoming is not None:
+                    self._incoming[vertex2].pop(vertex1, None)
+                self._changed()
+                if self._listeners:
+                    self._notify('remove_edge', vertex1, vertex2)
 
     def get_vertices(self):
         return list(self.graph.keys())
 
+    def iter_edges(self):
+        """
+        Yield every edge exactly once in O(E) time.
+
+        An undirected edge is stored in both adjacency dicts, so it is only
+        yielded from the endpoint that comes first in vertex order, as the old
+        list based dedup did. Vertices already passed are kept in a set (O(V)
+        extra memory), so labels never have to be comparable.
+        """
+        if self.directed:
+            for vertex, neighbors in self._adjacency.items():
+                for neighbor, weight in neighbors.items():
+                    yield vertex, neighbor, weight
+            return
+        passed = set()
+        for vertex, neighbors in self._adjacency.items():
+            for neighbor, weight in neighbors.items():
+                if neighbor not in passed:
+                    yield vertex, neighbor, weight
+            passed.add(vertex)
+
     def get_edges(self):
-        edges = []
-        for vertex in self.graph:
-            for neighbor, weight in self.graph[vertex]:
-                if self.directed:
-                    edges.append((vertex, neighbor, weight))
-                else:
-                    edge = tuple(sorted([vertex, neighbor]) + [weight])
-                    if edge not in edges:
-                        edges.append(edge)
-        return edges
+        return list(self.iter_edges())
+
+    def edge_array(self):
+        """Materialized edges as a tuple, cached until the graph changes."""
+        if self._edge_cache is None:
+            self._edge_cache = tuple(self.iter_edges())
+        return self._edge_cache
 
     def get_weight(self, vertex1, vertex2):
-        if vertex1 in self.graph:
-            for neighbor, weight in self.graph[vertex1]:
-                if neighbor == vertex2:
-                    return weight
+        if vertex1 in self._adjacency:
+            return self._adjacency[vertex1].get(vertex2)
         return None
 
+    def in_degree(self, vertex):
+        """O(1) on undirected graphs or with track_incoming, O(V) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            return sum(vertex in neighbors for neighbors in self._adjacency.values())
+        return len(predecessors[vertex])
+
+    def in_degrees(self):
+        """In-degree of every vertex. O(V) with the reverse index, O(V + E) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            in_degree = {vertex: 0 for vertex in self._adjacency}
+            for neighbors in self._adjacency.values():
+                for neighbor in neighbors:
+                    in_degree[neighbor] += 1
+            return in_degree
+        return {vertex: len(preds) for vertex, preds in predecessors.items()}
+
+    def predecessors(self, vertex):
+        """Vertices with an edge into vertex. O(deg) with the reverse index, O(V) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            return [v for v, neighbors in self._adjacency.items() if vertex in neighbors]
+        return list(predecessors[vertex])
+
+    def transpose(self):
+        """
+        The graph with every edge reversed.
+
+        O(1): undirected graphs are their own transpose and with track_incoming
+        this is a live view over the reverse index. Otherwise an O(V + E) copy.
+        """
+        if not self.directed:
+            return self
+        if self._incoming is not None:
+            return TransposedView(self)
+        transposed = WeightedGraph(directed=True)
+        for vertex in self._adjacency:
+            transposed.add_vertex(vertex)
+        for vertex1, vertex2, weight in self.iter_edges():
+            transposed.add_edge(vertex2, vertex1, weight)
+        return transposed
+
 # the code below works for unweighted graphs
 class UnweightedGraph:
-    def __init__(self, directed=False):
+    weighted = False
+
+    def __init__(self, directed=False, track_incoming=False):
         self.graph = {}
         self.directed = directed
+        # neighbor -> None dict per vertex, self.graph[vertex] is its live keys() view.
+        # Keeps insertion order like the old list but membership and removal are O(1)
+        self._adjacency = {}
+        # optional reverse index for directed graphs: vertex -> {predecessor: None}
+        self.track_incoming = track_incoming
+        self._incoming = {} if directed and track_incoming else None
+        self._incoming_views = {}
+        # bumped on every change, drops the cached edge_array()
+        self.version = 0
+        self._edge_cache = None
+        # copy-on-write state for snapshot(): writers hold the lock, _shared means
+        # the top-level dicts still belong to the last snapshot and _owned holds
+        # the vertices whose neighbor dicts were copied / created since then
+        # (None until the first snapshot, so graphs that never snapshot pay nothing)
+        self._lock = threading.RLock()
+        self._shared = False
+        self._owned = None
+        self._snapshot = None
+        # callables told about every change, see add_listener()
+        self._listeners = []
+
+    def _changed(self):
+        self.version += 1
+        self._edge_cache = None
+
+    def add_listener(self, listener):
+        """Call listener(event, vertex1, vertex2) after every change, see WeightedGraph.add_listener()."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify(self, event, vertex1, vertex2=None):
+        for listener in self._listeners:
+            listener(event, vertex1, vertex2)
+
+    def _start_batch(self, edges, endpoints):
+        # a snapshot may still share the neighbor dicts the batch writes to,
+        # copy them once up front so the edge loop can store into them directly
+        self._unshare()
+        if self._owned is not None:
+            adjacency = self._adjacency
+            for vertex in dict.fromkeys(chain.from_iterable(map(endpoints, edges))):
+                if vertex in adjacency:
+                    self._writable(vertex)
+
+    def _new_vertex(self, vertex):
+        # add_vertex() without locking, version bump or events, returns the neighbor dict
+        neighbors = self._adjacency[vertex] = {}
+        self.graph[vertex] = neighbors.keys()
+        if self._owned is not None:
+            self._owned.add(vertex)
+        if self._incoming is not None:
+            self._incoming[vertex] = {}
+            self._incoming_views[vertex] = self._incoming[vertex].keys()
+        return neighbors
+
+    def _finish_batch(self, edges):
+        self._changed()
+        if self._listeners:
+            self._notify('add_edges', edges)
+
+    def _load_rows(self, adjacency, incoming):
+        # install prebuilt neighbor dicts on an empty graph (from_arrays() fast path)
+        self._adjacency = adjacency
+        self.graph = {vertex: neighbors.items() if self.weighted else neighbors.keys()
+                      for vertex, neighbors in adjacency.items()}
+        if self._incoming is not None:
+            self._incoming = incoming
+            self._incoming_views = {vertex: predecessors.items() if self.weighted else predecessors.keys()
+                                    for vertex, predecessors in incoming.items()}
+        self._changed()
+
+    def _unshare(self):
+        # first write after a snapshot: stop sharing the top-level dicts with it
+        if self._shared:
+            self._adjacency = dict(self._adjacency)
+            self.graph = dict(self.graph)
+            self._shared = False
+
+    def _writable(self, vertex):
+        # neighbor dict of vertex that is safe to change in place
+        neighbors = self._adjacency[vertex]
+        if self._owned is not None and vertex not in self._owned:
+            neighbors = dict(neighbors)
+            self._adjacency[vertex] = neighbors
+            self.graph[vertex] = neighbors.keys()
+            self._owned.add(vertex)
+        return neighbors
+
+    def snapshot(self):
+        """
+        Immutable, versioned view of the graph for concurrent readers, in O(1).
+
+        Nothing is copied here. Later writes copy the top-level dicts once and
+        each neighbor dict the first time they touch it, so the snapshot never
+        sees a half-applied change and dijkstra / bfs can run on it from other
+        threads while this graph keeps being updated.
+        """
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.version:
+                self._snapshot = GraphSnapshot(self.graph, self.directed, False, self.version, self._edge_cache)
+                self._shared = True
+                self._owned = set()
+            return self._snapshot
+
+    def _predecessor_dicts(self):
+        if not self.directed:
+            return self._adjacency
+        return self._incoming
 
     def add_vertex(self, vertex):
-        if vertex not in self.graph:
-            self.graph[vertex] = []
+        with self._lock:
+            if vertex not in self.graph:
+                self._unshare()
+                self._adjacency[vertex] = {}
+                self.graph[vertex] = self._adjacency[vertex].keys()
+                if self._owned is not None:
+                    self._owned.add(vertex)
+                if self._incoming is not None:
+                    self._incoming[vertex] = {}
+                    self._incoming_views[vertex] = self._incoming[vertex].keys()
+                self._changed()
+                if self._listeners:
+                    self._notify('add_vertex', vertex)
 
     def add_edge(self, vertex1, vertex2, direction=None):
-        self.add_vertex(vertex1)
-        self.add_vertex(vertex2)
+        with self._lock:
+            if vertex1 not in self.graph:
+                self.add_vertex(vertex1)
+            if vertex2 not in self.graph:
+                self.add_vertex(vertex2)
+            self._unshare()
 
-        if vertex2 not in self.graph[vertex1]:
-            self.graph[vertex1].append(vertex2)
+            self._writable(vertex1)[vertex2] = None
 
-        if not self.directed and vertex1 not in self.graph[vertex2]:
-            self.graph[vertex2].append(vertex1)
+            if not self.directed:
+                self._writable(vertex2)[vertex1] = None
+            elif self._incoming is not None:
+                self._incoming[vertex2][vertex1] = None
+            self._changed()
+            if self._listeners:
+                self._notify('add_edge', vertex1, vertex2)
+
+    def add_edges_from(self, edges):
+        """Add an iterable of (vertex1, vertex2) tuples in one O(E) pass, see WeightedGraph.add_edges_from()."""
+        edges = edges if isinstance(edges, (list, tuple)) else list(edges)
+        with self._lock:
+            self._start_batch(edges, _endpoints)
+            adjacency = self._adjacency
+            new_vertex = self._new_vertex
+            # a failed store means a new vertex. vertex1 is created before
+            # vertex2, which keeps the first-seen vertex order of add_edge()
+            if not self.directed:
+                for vertex1, vertex2 in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = None
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = None
+                    try:
+                        adjacency[vertex2][vertex1] = None
+                    except KeyError:
+                        new_vertex(vertex2)[vertex1] = None
+            elif self._incoming is not None:
+                incoming = self._incoming
+                for vertex1, vertex2 in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = None
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = None
+                    if vertex2 not in adjacency:
+                        new_vertex(vertex2)
+                    incoming[vertex2][vertex1] = None
+            else:
+                for vertex1, vertex2 in edges:
+                    try:
+                        adjacency[vertex1][vertex2] = None
+                    except KeyError:
+                        new_vertex(vertex1)[vertex2] = None
+                    if vertex2 not in adjacency:
+                        new_vertex(vertex2)
+            self._finish_batch(edges)
+
+    @classmethod
+    def from_edge_list(cls, edges, directed=False, track_incoming=False):
+        """Build a graph from an iterable of (vertex1, vertex2) tuples."""
+        graph = cls(directed, track_incoming)
+        graph.add_edges_from(edges)
+        return graph
+
+    @classmethod
+    def from_arrays(cls, sources, targets, directed=False, track_incoming=False):
+        """Build a graph from parallel sequences (e.g. NumPy arrays), edge i is sources[i] -> targets[i]."""
+        if _numpy_labels(sources, targets):
+            graph = cls(directed, track_incoming)
+            graph._load_rows(*_rows_from_arrays(sources, targets, None, directed, graph._incoming is not None))
+            return graph
+        return cls.from_edge_list(zip(_as_list(sources), _as_list(targets)), directed, track_incoming)
 
     def remove_vertex(self, vertex):
-        if vertex in self.graph:
-            for v in self.graph:
-                if vertex in self.graph[v]:
-                    self.graph[v].remove(vertex)
+        with self._lock:
+            if vertex in self.graph:
+                self._unshare()
+                predecessors = self._predecessor_dicts()
+                if predecessors is None:
+                    predecessors = [v for v, neighbors in self._adjacency.items() if vertex in neighbors]
+                else:
+                    predecessors = list(predecessors[vertex])
+                for predecessor in predecessors:
+                    self._writable(predecessor).pop(vertex, None)
+                if self._incoming is not None:
+                    for successor in self._adjacency[vertex]:
+                        self._incoming[successor].pop(vertex, None)
+                    del self._incoming[vertex]
+                    del self._incoming_views[vertex]
 
-            del self.graph[vertex]
+                del self._adjacency[vertex]
+                del self.graph[vertex]
+                self._changed()
+                if self._listeners:
+                    self._notify('remove_vertex', vertex)
 
     def remove_edge(self, vertex1, vertex2):
-        if vertex1 in self.graph and vertex2 in self.graph:
-            if vertex2 in self.graph[vertex1]:
-                self.graph[vertex1].remove(vertex2)
-            if not self.directed and vertex1 in self.graph[vertex2]:
-                self.graph[vertex2].remove(vertex1)
+        with self._lock:
+            if vertex1 in self.graph and vertex2 in self.graph:
+                self._unshare()
+                self._writable(vertex1).pop(vertex2, None)
+                if not self.directed:
+                    self._writable(vertex2).pop(vertex1, None)
+                elif self._incoming is not None:
+                    self._incoming[vertex2].pop(vertex1, None)
+                self._changed()
+                if self._listeners:
+                    self._notify('remove_edge', vertex1, vertex2)
 
     def get_vertices(self):
         return list(self.graph.keys())
 
+    def iter_edges(self):
+        """
+        Yield every edge exactly once as a (vertex1, vertex2) tuple, in O(E) time.
+
+        Undirected edges are yielded from the endpoint that comes first in
+        vertex order only (see WeightedGraph.iter_edges).
+        """
+        if self.directed:
+            for vertex, neighbors in self.graph.items():
+                for neighbor in neighbors:
+                    yield vertex, neighbor
+            return
+        passed = set()
+        for vertex, neighbors in self.graph.items():
+            for neighbor in neighbors:
+                if neighbor not in passed:
+                    yield vertex, neighbor
+            passed.add(vertex)
+
     def get_edges(self):
-        edges = []
-        for vertex in self.graph:
-            for neighbor in self.graph[vertex]:
-                if self.directed:
-                    edges.append((vertex, neighbor))
-                else:
-                    if {vertex, neighbor} not in edges:
-                        edges.append({vertex, neighbor})
-        return edges
+        if self.directed:
+            return list(self.iter_edges())
+        return [{vertex, neighbor} for vertex, neighbor in self.iter_edges()]
+
+    def edge_array(self):
+        """Materialized edges as a tuple, cached until the graph changes."""
+        if self._edge_cache is None:
+            self._edge_cache = tuple(self.iter_edges())
+        return self._edge_cache
+
+    def in_degree(self, vertex):
+        """O(1) on undirected graphs or with track_incoming, O(V) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            return sum(vertex in neighbors for neighbors in self._adjacency.values())
+        return len(predecessors[vertex])
+
+    def in_degrees(self):
+        """In-degree of every vertex. O(V) with the reverse index, O(V + E) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            in_degree = {vertex: 0 for vertex in self._adjacency}
+            for neighbors in self._adjacency.values():
+                for neighbor in neighbors:
+                    in_degree[neighbor] += 1
+            return in_degree
+        return {vertex: len(preds) for vertex, preds in predecessors.items()}
+
+    def predecessors(self, vertex):
+        """Vertices with an edge into vertex. O(deg) with the reverse index, O(V) otherwise."""
+        predecessors = self._predecessor_dicts()
+        if predecessors is None:
+            return [v for v, neighbors in self._adjacency.items() if vertex in neighbors]
+        return list(predecessors[vertex])
+
+    def transpose(self):
+        """The graph with every edge reversed, see WeightedGraph.transpose()."""
+        if not self.directed:
+            return self
+        if self._incoming is not None:
+            return TransposedView(self)
+        transposed = UnweightedGraph(directed=True)
+        for vertex in self._adjacency:
+            transposed.add_vertex(vertex)
+        for vertex1, vertex2 in self.iter_edges():
+            transposed.add_edge(vertex2, vertex1)
+        return transposed
+
+
+class TransposedView:
+    """
+    Read-only reversed graph backed by the incoming-edge index of a
+    WeightedGraph / UnweightedGraph built with track_incoming=True.
+
+    Nothing is copied, so it follows later changes to the original graph.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph._incoming_views
+        self.directed = True
+        self.weighted = graph.weighted
+        self._original = graph
+
+    def get_vertices(self):
+        return list(self.graph.keys())
+
+    def in_degrees(self):
+        """In-degrees of the reversed graph, i.e. the out-degrees of the original, in O(V)."""
+        return {vertex: len(neighbors) for vertex, neighbors in self._original._adjacency.items()}
+
+
+class GraphSnapshot:
+    """
+    Frozen view returned by WeightedGraph.snapshot() / UnweightedGraph.snapshot().
+
+    Shares its dicts with the graph it came from and the graph copies them
+    before writing (copy-on-write), so every algorithm that reads graph.graph
+    can run on it from any thread without locking.
+    """
+
+    def __init__(self, graph, directed, weighted, version, edge_cache=None):
+        self.graph = graph
+        self.directed = directed
+        self.weighted = weighted
+        self.version = version
+        self._edge_cache = edge_cache
+
+    def get_vertices(self):
+        return list(self.graph.keys())
+
+    def iter_edges(self):
+        """Same edges as the graph's iter_edges() at snapshot time."""
+        passed = set()
+        for vertex, neighbors in self.graph.items():
+            for neighbor, weight in neighbors.mapping.items():
+                if self.directed or neighbor not in passed:
+                    yield (vertex, neighbor, weight) if self.weighted else (vertex, neighbor)
+            if not self.directed:
+                passed.add(vertex)
+
+    def get_edges(self):
+        if self.weighted or self.directed:
+            return list(self.iter_edges())
+        return [{vertex, neighbor} for vertex, neighbor in self.iter_edges()]
+
+    def edge_array(self):
+        if self._edge_cache is None:
+            self._edge_cache = tuple(self.iter_edges())
+        return self._edge_cache
+
+    def get_weight(self, vertex1, vertex2):
+        if vertex1 in self.graph:
+            return self.graph[vertex1].mapping.get(vertex2)
+        return None
+
+    def in_degrees(self):
+        in_degree = {vertex: 0 for vertex in self.graph}
+        for neighbors in self.graph.values():
+            for neighbor in neighbors.mapping:
+                in_degree[neighbor] += 1
+        return in_degree
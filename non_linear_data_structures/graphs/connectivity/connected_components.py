@@ -0,0 +1,117 @@
+from ..___archive.list_basic_graph_implementation import iter_neighbors
+from ..minimum_spanning_tree.kruskal import UnionFind
+
+
+def connected_components(graph):
+    """
+    Connected components of an undirected graph as lists of vertices.
+
+    Directed graphs give their weakly connected components (edge direction
+    is ignored).
+
+    Time Complexity: O((V + E) α(V))
+    Space Complexity: O(V)
+    """
+    components = IncrementalComponents(graph, follow=False)
+    return components.components()
+
+
+class IncrementalComponents:
+    """
+    Connected components that stay current while the graph grows.
+
+    A UnionFind over the vertices is built once and then registered as a
+    listener on the graph, so every add_vertex / add_edge is applied as it
+    happens in near O(1) instead of re-running a BFS per batch of edges.
+    Union-find can't split sets, so a removal only marks the index stale and
+    it is rebuilt in O(V + E) on the next query.
+
+    Queries are near O(1) (inverse Ackermann) while only edges are added.
+
+    Example:
+        components = IncrementalComponents(graph)
+        graph.add_edge('a', 'b')
+        components.same_component('a', 'b')   # True
+        components.close()                    # stop following the graph
+    """
+
+    def __init__(self, graph, follow=True):
+        """
+        Args:
+            graph: Undirected graph (directed ones give weakly connected components)
+            follow: Register on graph.add_listener() to track later changes.
+                Graphs without listeners (CSRGraph, snapshots) are never followed
+        """
+        self.graph = graph
+        self.union_find = None
+        self._stale = True
+        self._following = follow and hasattr(graph, 'add_listener')
+        if self._following:
+            graph.add_listener(self._on_change)
+        self._rebuild()
+
+    def _rebuild(self):
+        union_find = UnionFind(self.graph.graph)
+        for vertex in self.graph.graph:
+            for neighbor in iter_neighbors(self.graph, vertex):
+                union_find.union(vertex, neighbor)
+        self.union_find = union_find
+        self._stale = False
+
+    def _on_change(self, event, vertex1, vertex2):
+        if self._stale:
+            return
+        if event == 'add_vertex':
+            self.union_find.add(vertex1)
+        elif event == 'add_edge':
+            self.union_find.union(vertex1, vertex2)
+        elif event == 'add_edges':
+            # one event per add_edges_from() batch, vertex1 holds the edge tuples
+            union_find = self.union_find
+            for edge in vertex1:
+                union_find.add(edge[0])
+                union_find.add(edge[1])
+                union_find.union(edge[0], edge[1])
+        else:
+            # removals can split a component, recount lazily
+            self._stale = True
+
+    def _current(self):
+        if self._stale:
+            self._rebuild()
+        return self.union_find
+
+    def close(self):
+        """Stop following the graph (the last state stays queryable)."""
+        if self._following:
+            self.graph.remove_listener(self._on_change)
+            self._following = False
+
+    def same_component(self, vertex1, vertex2):
+        """True if a path connects the two vertices, False for unknown vertices."""
+        union_find = self._current()
+        if vertex1 not in union_find.parent or vertex2 not in union_find.parent:
+            return False
+        return union_find.find(vertex1) == union_find.find(vertex2)
+
+    def component_size(self, vertex):
+        """Number of vertices in vertex's component (0 for an unknown vertex)."""
+        union_find = self._current()
+        if vertex not in union_find.parent:
+            return 0
+        return union_find.set_size(vertex)
+
+    def num_components(self):
+        return self._current().count
+
+    def component_id(self, vertex):
+        """Representative vertex of the component, stable until the next union."""
+        return self._current().find(vertex)
+
+    def components(self):
+        """All components as lists of vertices, O(V)."""
+        union_find = self._current()
+        groups = {}
+        for vertex in union_find.parent:
+            groups.setdefault(union_find.find(vertex), []).append(vertex)
+        return list(groups.values())
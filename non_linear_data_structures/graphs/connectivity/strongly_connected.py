@@ -0,0 +1,145 @@
+from array import array
+
+from ..___archive.list_basic_graph_implementation import UnweightedGraph
+from ..representation.csr_graph import as_csr
+
+
+def strongly_connected_components(graph):
+    """
+    Tarjan's strongly connected components, iterative, on interned vertex ids.
+
+    The DFS keeps an explicit stack of (vertex, next edge position) frames
+    instead of recursing, so graph size is only limited by memory. Per-vertex
+    state lives in flat arrays indexed by id.
+
+    Tarjan finishes components sinks first, i.e. in reverse topological order
+    of the condensation. Ids are handed out backwards, so component 0 has no
+    incoming edges from other components and every edge between components goes
+    from a lower id to a higher one.
+
+    Time Complexity: O(V + E)
+    Space Complexity: O(V), plus the CSR copy for list based graphs
+
+    Args:
+        graph: Directed WeightedGraph / UnweightedGraph / CSRGraph
+
+    Returns:
+        tuple: (labels, component) with component an array('i') where
+            component[i] is the component id of labels[i], ids are 0..k-1
+    """
+    csr = as_csr(graph)
+    return list(csr.labels), _tarjan(csr)
+
+
+def _tarjan(csr):
+    offsets, targets = csr.offsets, csr.targets
+    n = len(csr.labels)
+
+    unvisited = -1
+    index = array('i', [unvisited]) * n
+    low = array('i', [0]) * n
+    on_stack = bytearray(n)
+    component = array('i', [0]) * n
+    stack = []
+    counter = 0
+    finished = []
+
+    for root in range(n):
+        if index[root] != unvisited:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        frames = [(root, offsets[root])]
+
+        while frames:
+            vertex, position = frames[-1]
+            end = offsets[vertex + 1]
+            descended = False
+            while position < end:
+                neighbor = targets[position]
+                position += 1
+                if index[neighbor] == unvisited:
+                    # remember where to resume, then "recurse" into neighbor
+                    frames[-1] = (vertex, position)
+                    index[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    frames.append((neighbor, offsets[neighbor]))
+                    descended = True
+                    break
+                if on_stack[neighbor] and index[neighbor] < low[vertex]:
+                    low[vertex] = index[neighbor]
+            if descended:
+                continue
+
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                if low[vertex] < low[parent]:
+                    low[parent] = low[vertex]
+            if low[vertex] == index[vertex]:
+                # vertex is the root of a component: pop it off the stack
+                members = len(finished)
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    component[member] = members
+                    if member == vertex:
+                        break
+                finished.append(vertex)
+
+    # renumber so ids follow topological order of the condensation
+    last = len(finished) - 1
+    for vertex in range(n):
+        component[vertex] = last - component[vertex]
+    return component
+
+
+def scc_groups(graph):
+    """
+    Strongly connected components as lists of vertices.
+
+    Returns:
+        list: One list per component, in topological order of the condensation
+    """
+    labels, component = strongly_connected_components(graph)
+    groups = [[] for _ in range(max(component, default=-1) + 1)]
+    for label, component_id in zip(labels, component):
+        groups[component_id].append(label)
+    return groups
+
+
+def condensation(graph):
+    """
+    The condensation DAG: every strongly connected component collapsed to one vertex.
+
+    Args:
+        graph: Directed WeightedGraph / UnweightedGraph / CSRGraph
+
+    Returns:
+        tuple: (dag, labels, component) with dag a directed UnweightedGraph over
+            component ids 0..k-1 (no self loops or duplicate edges), ready for
+            kahn_topological_sort(); labels / component as returned by
+            strongly_connected_components()
+    """
+    csr = as_csr(graph)
+    component = _tarjan(csr)
+    labels = list(csr.labels)
+    offsets, targets = csr.offsets, csr.targets
+
+    edges = set()
+    for vertex in range(len(labels)):
+        source = component[vertex]
+        for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+            target = component[neighbor]
+            if source != target:
+                edges.add((source, target))
+
+    dag = UnweightedGraph(directed=True)
+    for component_id in range(max(component, default=-1) + 1):
+        dag.add_vertex(component_id)
+    dag.add_edges_from(sorted(edges))
+    return dag, labels, component
@@ -1,48 +1,19 @@
+from ..traversal.dfs_list_graph import BACK_EDGE, dfs_events, find_cycle
+
 def is_cyclic(graph, start_vertex, visiting=None, visited=None):
-    if visiting is None:
-        visiting = set()
+    # a back edge (to a vertex still on the DFS stack) is exactly a cycle.
+    # visiting is kept for compatibility, the engine tracks the stack itself
     if visited is None:
         visited = set()
-
-    visiting.add(start_vertex)
-
-    for neighbor in graph.graph[start_vertex]:
-        if neighbor in visiting:
+    for event, _, _ in dfs_events(graph, start_vertex, visited):
+        if event == BACK_EDGE:
             return True
-        if neighbor not in visited:
-            if is_cyclic(graph, neighbor, visiting, visited):
-                return True
-
-    visiting.remove(start_vertex)
-    visited.add(start_vertex)
     return False
 
 def cycle_path(graph, start_vertex):
-    visited = set()
-    stack = []
-    parent = {start_vertex: None}
-
-    def dfs_cycle(vertex):
-        visited.add(vertex)
-        stack.append(vertex)
-
-        for neighbor in graph.graph[vertex]:
-            if neighbor not in visited:
-                parent[neighbor] = vertex
-                return True
-            elif neighbor in stack:
-                cycle = []
-                current = vertex
-                while current != neighbor:
-                    cycle.append(current)
-                    current = parent[current]
-                cycle.append(neighbor)
-                cycle.append(vertex)
-                # print(f"Cycle found: {' -> '.join(cycle)}")
-                # return True
-                return cycle
-
-        stack.pop()
-        return False
+    # [v, ..., u, v] following edge direction, False when no cycle is reachable
+    return find_cycle(graph, start_vertex) or False
 
-    return dfs_cycle(start_vertex)
+def has_cycle_directed(graph):
+    # whole graph, not just what is reachable from one start vertex
+    return find_cycle(graph) is not None
@@ -1,81 +1,17 @@
+from ..traversal.dfs_list_graph import BACK_EDGE, dfs_events, find_cycle
+
+# dfs_events handles both cases: directed graphs report back edges to the DFS
+# stack, undirected ones skip the edge back to the parent. Weights of
+# weighted graphs are dropped there as well (see iter_neighbors)
+
 def is_cyclic(graph, start_vertex, visiting=None, visited=None, parent=None):
-    if visiting is None:
-        visiting = set()
     if visited is None:
         visited = set()
-    if parent is None:
-        parent = None
-
-    visiting.add(start_vertex)
-
-    neighbors = graph.graph[start_vertex]
-    for neighbor in neighbors:
-        # Handle both weighted and unweighted graphs
-        if isinstance(neighbor, tuple):
-            neighbor_vertex = neighbor[0]
-        else:
-            neighbor_vertex = neighbor
-
-        #skips the edge back to parent if undirected graph
-        if not graph.directed and neighbor_vertex == parent:
-            continue
-
-        if neighbor_vertex in visiting:
-            return True
-        if neighbor_vertex not in visited:
-            if is_cyclic(graph, neighbor_vertex, visiting, visited, start_vertex):
-                return True
-        #skips the edge back to parent if undirected graph
-        if not graph.directed and neighbor == parent:
-            continue
-
-        if neighbor in visiting:
+    for event, _, _ in dfs_events(graph, start_vertex, visited):
+        if event == BACK_EDGE:
             return True
-        if neighbor not in visited:
-            if is_cyclic(graph, neighbor, visiting, visited, start_vertex):
-                return True
-
-    visiting.remove(start_vertex)
-    visited.add(start_vertex)
     return False
 
 def cycle_path(graph, start_vertex):
-    visited = set()
-    stack = []
-    parent = {start_vertex: None}
-
-    def dfs_cycle(vertex, parent_vertex=None):
-        visited.add(vertex)
-        stack.append(vertex)
-
-        neighbors = graph.graph[vertex]
-        for neighbor in neighbors:
-            #this will handle both weighted and unweighted graphs
-            if isinstance(neighbor, tuple):
-                neighbor_vertex = neighbor[0]
-            else:
-                neighbor_vertex = neighbor
-
-            #skips the edge back to parent if undirected graph
-            if not graph.directed and neighbor_vertex == parent_vertex:
-                continue
-
-            if neighbor_vertex not in visited:
-                parent[neighbor_vertex] = vertex
-                result = dfs_cycle(neighbor_vertex, vertex)
-                if result:
-                    return result
-            elif neighbor_vertex in stack:
-                cycle = []
-                current = vertex
-                while current != neighbor_vertex:
-                    cycle.append(current)
-                    current = parent[current]
-                cycle.append(neighbor_vertex)
-                cycle.append(vertex)
-                return cycle
-
-        stack.pop()
-        return False
-
-    return dfs_cycle(start_vertex)
+    # [v, ..., u, v] following edge direction, False when no cycle is reachable
+    return find_cycle(graph, start_vertex) or False
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""CSR Graph Benchmark
+
+This module compares the memory footprint and traversal speed of the list based
+graph classes against their frozen CSR form.
+
+Run from the non_linear_data_structures directory:
+    python -m graphs.demonstrations.csr_benchmark_demo
+"""
+
+import random
+import time
+import tracemalloc
+
+from ..___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from ..representation.csr_graph import CSRGraph
+from ..topological_sort.kahn import kahn_topological_sort
+from ..traversal.bfs_list_graph import bfs
+from ..traversal.dfs_list_graph import dfs_iterative
+
+
+def print_subsection_header(title):
+    """Print a formatted subsection header"""
+    print("\n" + "-" * 60)
+    print(f" {title} ".center(60, "-"))
+    print("-" * 60)
+
+
+def random_edges(num_vertices, num_edges, seed=42):
+    """Random edge list with string labels, like the test graphs"""
+    rng = random.Random(seed)
+    return [
+        (str(rng.randrange(num_vertices)), str(rng.randrange(num_vertices)), rng.randint(1, 100))
+        for _ in range(num_edges)
+    ]
+
+
+def measure_allocation(build):
+    """Return (result, bytes still allocated by build())"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def best_of(runs, func, *args):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build_weighted(edges):
+    g = WeightedGraph(directed=True)
+    for v1, v2, weight in edges:
+        g.add_edge(v1, v2, weight)
+    return g
+
+
+def build_unweighted(edges):
+    g = UnweightedGraph(directed=True)
+    for v1, v2, _ in edges:
+        g.add_edge(v1, v2)
+    return g
+
+
+def benchmark_csr(num_vertices=20000, num_edges=100000, runs=3):
+    """Compare list form vs CSR form on a random directed graph"""
+    edges = random_edges(num_vertices, num_edges)
+    start_vertex = edges[0][0]
+
+    print_subsection_header("Memory")
+    weighted_graph, list_bytes = measure_allocation(lambda: build_weighted(edges))
+    weighted_csr, csr_bytes = measure_allocation(lambda: CSRGraph.from_graph(weighted_graph))
+    print(f"WeightedGraph (list form): {list_bytes / 1e6:8.2f} MB")
+    print(f"CSRGraph (incl. label index): {csr_bytes / 1e6:8.2f} MB")
+    print(f"CSRGraph buffers only:     {weighted_csr.nbytes() / 1e6:8.2f} MB")
+    print(f"Edges: {weighted_csr.num_edges()}, bytes per edge: "
+          f"{list_bytes / weighted_csr.num_edges():.1f} (list) vs "
+          f"{weighted_csr.nbytes() / weighted_csr.num_edges():.1f} (CSR buffers)")
+
+    print_subsection_header("Traversal speed (best of %d)" % runs)
+    unweighted_graph = build_unweighted(edges)
+    unweighted_csr = CSRGraph.from_graph(unweighted_graph)
+    for name, func, args in [
+        ("bfs", bfs, (start_vertex,)),
+        ("dfs_iterative", dfs_iterative, (start_vertex,)),
+        ("kahn", kahn_topological_sort, ()),
+    ]:
+        list_time = best_of(runs, func, unweighted_graph, *args)
+        csr_time = best_of(runs, func, unweighted_csr, *args)
+        print(f"{name:14} list: {list_time * 1000:9.2f} ms   csr: {csr_time * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark_csr()
@@ -1,9 +1,11 @@
 # Kruskal's Algorithm without using Union-Find
 def kruskals_mst(adj_list):
     edges = []
+    seen = set()
     for vertex in adj_list:
         for neighbor, weight in adj_list[vertex]:
-            if (neighbor, vertex, weight) not in edges:
+            if (neighbor, vertex, weight) not in seen:
+                seen.add((vertex, neighbor, weight))
                 edges.append((vertex, neighbor, weight))
     
     edges.sort(key=lambda x: x[2])
@@ -33,7 +35,18 @@ def kruskals_mst(adj_list):
 class UnionFind:
     def __init__(self, vertices):
         self.parent = {vertex: vertex for vertex in vertices}
-        self.rank = {vertex: 0 for vertex in vertices}
+        self.rank = {vertex: 0 for vertex in self.parent}
+        # size is only kept up to date for roots
+        self.size = {vertex: 1 for vertex in self.parent}
+        self.count = len(self.parent)
+
+    def add(self, vertex):
+        # new singleton set, no-op for known vertices
+        if vertex not in self.parent:
+            self.parent[vertex] = vertex
+            self.rank[vertex] = 0
+            self.size[vertex] = 1
+            self.count += 1
     
     def find(self, vertex):
         if self.parent[vertex] != vertex:
@@ -41,6 +54,7 @@ class UnionFind:
         return self.parent[vertex]
     
     def union(self, vertex1, vertex2):
+        # returns True when two different sets were merged
         root1 = self.find(vertex1)
         root2 = self.find(vertex2)
         
@@ -48,8 +62,15 @@ class UnionFind:
             if self.rank[root1] < self.rank[root2]:
                 root1, root2 = root2, root1
             self.parent[root2] = root1
+            self.size[root1] += self.size[root2]
+            self.count -= 1
             if self.rank[root1] == self.rank[root2]:
                 self.rank[root1] += 1
+            return True
+        return False
+
+    def set_size(self, vertex):
+        return self.size[self.find(vertex)]
 
 def kruskals_mst_union_find(graph):
     if graph.directed:
@@ -58,13 +79,7 @@ def kruskals_mst_union_find(graph):
     if not graph.graph:
         return [], 0
     
-    edges = []
-    for vertex in graph.graph:
-        for neighbor, weight in graph.graph[vertex]:
-            if (neighbor, vertex, weight) not in edges:
-                edges.append((vertex, neighbor, weight))
-    
-    edges.sort(key=lambda x: x[2])
+    edges = sorted(graph.iter_edges(), key=lambda x: x[2])
     
     uf = UnionFind(graph.graph.keys())
     
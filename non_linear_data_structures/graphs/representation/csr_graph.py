@@ -0,0 +1,234 @@
+from array import array
+from collections.abc import Mapping
+from itertools import accumulate
+
+from .interning import VertexInterner
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def buffer_typecode(buffer):
+    # array.array has .typecode, a memoryview (e.g. over an mmap) has .format
+    return getattr(buffer, 'typecode', None) or buffer.format
+
+
+class CSRAdjacency(Mapping):
+    """
+    Read-only stand-in for the ``graph.graph`` dict of the list based graphs.
+
+    Rows are decoded from the CSR buffers on access, so algorithms that do
+    ``for neighbor, weight in graph.graph[vertex]`` (or ``for neighbor in ...``
+    on unweighted graphs) work on a CSRGraph unchanged.
+    """
+
+    def __init__(self, csr):
+        self._csr = csr
+
+    def __getitem__(self, vertex):
+        return self._csr.neighbors(vertex)
+
+    def __contains__(self, vertex):
+        return vertex in self._csr.index
+
+    def __iter__(self):
+        return iter(self._csr.labels)
+
+    def __len__(self):
+        return len(self._csr.labels)
+
+
+class CSRGraph:
+    """
+    Frozen compressed sparse row form of a WeightedGraph / UnweightedGraph.
+
+    Vertex labels are interned to ints 0..V-1 (``interner``, with ``labels`` /
+    ``index`` as shortcuts) and the adjacency lives in three flat typed buffers:
+        - offsets: row i is targets[offsets[i]:offsets[i + 1]]
+        - targets: neighbor ids, in the same order as the source adjacency list
+        - weights: edge weights parallel to targets (None for unweighted graphs)
+
+    An undirected edge is stored in both rows, exactly like the list form.
+
+    Memory: ~4 bytes per target + 8 bytes per weight + 8 bytes per vertex,
+    instead of a list slot plus a (neighbor, weight) tuple per edge.
+    """
+
+    def __init__(self, labels, offsets, targets, weights=None, directed=False, interner=None):
+        # algorithms check for this attribute to switch to their id based fast paths
+        self.interner = interner if interner is not None else VertexInterner(labels)
+        self.labels = self.interner.labels
+        self.index = self.interner.index
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self.weighted = weights is not None
+        self.graph = CSRAdjacency(self)
+        self.version = 0
+        self._edge_cache = None
+        self._transposed = None
+
+    @classmethod
+    def from_graph(cls, graph, weighted=None):
+        """
+        Build the CSR form of a list based graph in one pass over its adjacency.
+
+        Args:
+            graph: WeightedGraph or UnweightedGraph instance
+            weighted: Force weighted / unweighted rows. By default this is the
+                graph's weighted flag (an edgeless WeightedGraph still gets an
+                empty weights buffer)
+
+        Returns:
+            CSRGraph
+        """
+        interner = VertexInterner(graph.graph)
+        labels, index = interner.labels, interner.index
+
+        if weighted is None:
+            weighted = getattr(graph, 'weighted', False)
+
+        offsets = array('q', [0])
+        targets = array('i' if len(labels) < 2 ** 31 else 'q')
+        weights = array('q') if weighted else None
+
+        for vertex in labels:
+            row = graph.graph[vertex]
+            if weighted:
+                for neighbor, weight in row:
+                    targets.append(index[neighbor])
+                    try:
+                        weights.append(weight)
+                    except (TypeError, OverflowError):
+                        # first non-integer weight, switch the whole buffer to floats
+                        weights = array('d', weights)
+                        weights.append(weight)
+            else:
+                targets.extend(map(index.__getitem__, row))
+            offsets.append(len(targets))
+
+        return cls(labels, offsets, targets, weights, graph.directed, interner)
+
+    def as_numpy(self):
+        """
+        Zero-copy NumPy views of the buffers (array.array or mmap backed memoryview).
+
+        Returns:
+            tuple: (offsets, targets, weights) ndarrays, weights is None for unweighted graphs
+        """
+        if np is None:
+            raise ImportError("NumPy is required for CSRGraph.as_numpy()")
+
+        offsets = np.asarray(self.offsets)
+        targets = np.asarray(self.targets)
+        weights = None if self.weights is None else np.asarray(self.weights)
+        return offsets, targets, weights
+
+    def neighbor_ids(self, vertex_id):
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def neighbors(self, vertex):
+        i = self.index[vertex]
+        start, end = self.offsets[i], self.offsets[i + 1]
+        names = map(self.labels.__getitem__, self.targets[start:end])
+        if self.weights is None:
+            return list(names)
+        return list(zip(names, self.weights[start:end]))
+
+    def get_vertices(self):
+        return list(self.labels)
+
+    def iter_edges(self):
+        """Yield every edge once, undirected edges from their lower id endpoint (see WeightedGraph.iter_edges)."""
+        labels = self.labels
+        for i, vertex in enumerate(labels):
+            for pos in range(self.offsets[i], self.offsets[i + 1]):
+                # ids follow vertex order, so this is the first endpoint without comparing labels
+                j = self.targets[pos]
+                if self.directed or i <= j:
+                    if self.weights is None:
+                        yield vertex, labels[j]
+                    else:
+                        yield vertex, labels[j], self.weights[pos]
+
+    def get_edges(self):
+        if self.weights is None and not self.directed:
+            return [{vertex, neighbor} for vertex, neighbor in self.iter_edges()]
+        return list(self.iter_edges())
+
+    def edge_array(self):
+        """Materialized edges as a tuple, built once since the graph is frozen."""
+        if self._edge_cache is None:
+            self._edge_cache = tuple(self.iter_edges())
+        return self._edge_cache
+
+    def get_weight(self, vertex1, vertex2):
+        if vertex1 in self.index and vertex2 in self.index:
+            i, j = self.index[vertex1], self.index[vertex2]
+            for pos in range(self.offsets[i], self.offsets[i + 1]):
+                if self.targets[pos] == j:
+                    return self.weights[pos] if self.weights is not None else 1
+        return None
+
+    def transpose(self):
+        """
+        CSRGraph with every edge reversed, so row i lists the in-neighbors of i.
+
+        Built once with a counting sort in O(V + E) and cached (the graph is
+        frozen). Undirected graphs are their own transpose.
+        """
+        if not self.directed:
+            return self
+        if self._transposed is None:
+            n = len(self.labels)
+            counts = [0] * (n + 1)
+            for target in self.targets:
+                counts[target + 1] += 1
+            offsets = array('q', accumulate(counts))
+
+            next_slot = list(offsets[:-1])
+            targets = array(buffer_typecode(self.targets), [0]) * len(self.targets)
+            weights = None
+            if self.weights is not None:
+                weights = array(buffer_typecode(self.weights), [0]) * len(self.weights)
+            for source in range(n):
+                for position in range(self.offsets[source], self.offsets[source + 1]):
+                    target = self.targets[position]
+                    slot = next_slot[target]
+                    next_slot[target] += 1
+                    targets[slot] = source
+                    if weights is not None:
+                        weights[slot] = self.weights[position]
+
+            self._transposed = CSRGraph(self.labels, offsets, targets, weights, True, self.interner)
+        return self._transposed
+
+    def in_degrees(self):
+        in_degree = [0] * len(self.labels)
+        for target in self.targets:
+            in_degree[target] += 1
+        return dict(zip(self.labels, in_degree))
+
+    def num_vertices(self):
+        return len(self.labels)
+
+    def num_edges(self):
+        """Number of stored adjacency entries (undirected edges count twice)."""
+        return len(self.targets)
+
+    def nbytes(self):
+        """Bytes held by the offset / target / weight buffers."""
+        total = len(self.offsets) * self.offsets.itemsize + len(self.targets) * self.targets.itemsize
+        if self.weights is not None:
+            total += len(self.weights) * self.weights.itemsize
+        return total
+
+
+def as_csr(graph):
+    """The graph itself when it is already interned (a CSRGraph), else its CSR form."""
+    if getattr(graph, 'interner', None) is not None:
+        return graph
+    return CSRGraph.from_graph(graph)
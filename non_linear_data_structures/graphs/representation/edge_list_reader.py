@@ -0,0 +1,145 @@
+import gzip
+from itertools import islice
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class ReadStats:
+    """Counters filled in while an edge-list file is read."""
+
+    def __init__(self):
+        self.lines = 0
+        self.edges = 0
+        self.chunks = 0
+        self.skipped_comments = 0
+        self.skipped_malformed = 0
+
+    def __repr__(self):
+        return (f"ReadStats(lines={self.lines}, edges={self.edges}, chunks={self.chunks}, "
+                f"skipped_comments={self.skipped_comments}, skipped_malformed={self.skipped_malformed})")
+
+
+def _open_binary(path):
+    with open(path, 'rb') as file:
+        is_gzip = file.read(2) == GZIP_MAGIC
+    return gzip.open(path, 'rb') if is_gzip else open(path, 'rb')
+
+
+def _default_delimiter(path):
+    name = str(path).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    return '\t' if name.endswith('.tsv') else ','
+
+
+def _parse_weight(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _parse_edges(lines, delimiter, weighted, stats):
+    for raw in lines:
+        stats.lines += 1
+        try:
+            line = raw.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            stats.skipped_malformed += 1
+            continue
+
+        if not line or line.startswith('#'):
+            stats.skipped_comments += 1
+            continue
+
+        fields = [field.strip() for field in line.split(delimiter)]
+        if len(fields) not in (2, 3) or not fields[0] or not fields[1]:
+            stats.skipped_malformed += 1
+            continue
+
+        if not weighted:
+            yield fields[0], fields[1]
+            continue
+
+        try:
+            weight = _parse_weight(fields[2]) if len(fields) == 3 else 1
+        except ValueError:
+            stats.skipped_malformed += 1
+            continue
+        yield fields[0], fields[1], weight
+
+
+def read_edge_chunks(path, chunk_size=100000, delimiter=None, weighted=True, skip_header=False,
+                     stats=None, progress=None):
+    """
+    Stream ``src,dst[,weight]`` lines from a (optionally gzipped) edge-list file.
+
+    Lines are read lazily and handed out as lists of at most chunk_size edges,
+    so memory stays bounded by the chunk size however large the file is.
+    Blank lines and '#' comments are skipped, and so are malformed lines (wrong
+    field count, empty vertex, bad weight, undecodable bytes). Skipped lines
+    are only counted in stats, they never raise.
+
+    Args:
+        path: CSV / TSV file, gzip input is detected from its magic bytes
+        chunk_size: Maximum number of edges per yielded list
+        delimiter: Field separator, by default tab for *.tsv[.gz] and comma otherwise
+        weighted: Yield (src, dst, weight) tuples, weight defaults to 1 when missing.
+            With False the weight column is ignored and (src, dst) tuples are yielded
+        skip_header: Drop the first line of the file
+        stats: ReadStats to update, a new one is used when None
+        progress: Called with the ReadStats after every chunk
+
+    Returns:
+        Iterator of lists of edge tuples with string vertex labels
+
+    Raises:
+        ValueError: If chunk_size is less than 1 (raised here, not on the first chunk)
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    return _read_edge_chunks(path, chunk_size, delimiter, weighted, skip_header, stats, progress)
+
+
+def _read_edge_chunks(path, chunk_size, delimiter, weighted, skip_header, stats, progress):
+    if stats is None:
+        stats = ReadStats()
+    if delimiter is None:
+        delimiter = _default_delimiter(path)
+
+    with _open_binary(path) as file:
+        if skip_header:
+            next(file, None)
+        edges = _parse_edges(file, delimiter, weighted, stats)
+        while True:
+            chunk = list(islice(edges, chunk_size))
+            if not chunk:
+                break
+            stats.edges += len(chunk)
+            stats.chunks += 1
+            if progress is not None:
+                progress(stats)
+            yield chunk
+
+
+def load_edge_list(path, graph, chunk_size=100000, delimiter=None, skip_header=False, progress=None):
+    """
+    Load an edge-list file chunk by chunk into a graph.
+
+    Args:
+        path: CSV / TSV file (optionally gzipped), see read_edge_chunks()
+        graph: WeightedGraph or UnweightedGraph to fill. Wrap the result with
+            CSRGraph.from_graph() for the compact form
+        chunk_size: Edges parsed and inserted per step
+        delimiter: Field separator, detected from the file name when None
+        skip_header: Drop the first line of the file
+        progress: Called with the ReadStats after every chunk
+
+    Returns:
+        ReadStats: Line, edge and skip counters of the read
+    """
+    stats = ReadStats()
+    weighted = hasattr(graph, 'get_weight')
+    for chunk in read_edge_chunks(path, chunk_size, delimiter, weighted, skip_header, stats, progress):
+        graph.add_edges_from(chunk)
+    return stats
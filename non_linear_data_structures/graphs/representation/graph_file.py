@@ -0,0 +1,120 @@
+import json
+import mmap
+import struct
+
+from .csr_graph import CSRGraph, buffer_typecode
+from .interning import IdentityInterner, VertexInterner
+
+# File layout (native byte order, every section starts on an 8 byte boundary):
+#   header   magic, flags, target / weight typecodes, V, E, label table size
+#   offsets  (V + 1) int64
+#   targets  E ints of the target typecode
+#   weights  E values of the weight typecode (only for weighted graphs)
+#   labels   JSON list of vertex labels, position i is vertex id i (left out
+#            when the labels are the ids 0..V-1 themselves, see IDENTITY_LABELS)
+MAGIC = b'CSRGRAPH'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('=8sIIccxxQQQ')
+HEADER_SIZE = 64
+DIRECTED = 1
+IDENTITY_LABELS = 2
+NO_WEIGHTS = b'-'
+
+
+def _write_section(file, buffer):
+    data = memoryview(buffer).cast('B')
+    file.write(data)
+    file.write(b'\0' * (-len(data) % 8))
+
+
+def _read_section(view, position, typecode, count):
+    size = struct.calcsize(typecode) * count
+    section = view[position:position + size].cast(typecode)
+    return section, position + size + (-size % 8)
+
+
+def save_graph(graph, path):
+    """
+    Write a graph in the binary CSR format read by load_graph().
+
+    Args:
+        graph: CSRGraph, or a WeightedGraph / UnweightedGraph (converted first)
+        path: Output file path
+
+    Vertex labels are stored as JSON, so they have to be strings or numbers.
+    Labels that are exactly the ids 0..V-1 are not stored at all, and such a
+    graph loads without decoding or indexing anything.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    flags = DIRECTED if csr.directed else 0
+    if _identity_labels(csr.labels):
+        flags |= IDENTITY_LABELS
+        labels = b''
+    else:
+        for label in csr.labels:
+            if not isinstance(label, (str, int, float)):
+                raise TypeError(f"Vertex label {label!r} can't be stored, use str or numeric labels")
+        labels = json.dumps(csr.labels).encode('utf-8')
+
+    target_code = buffer_typecode(csr.targets).encode()
+    weight_code = NO_WEIGHTS if csr.weights is None else buffer_typecode(csr.weights).encode()
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, flags, target_code, weight_code,
+                         csr.num_vertices(), csr.num_edges(), len(labels))
+
+    with open(path, 'wb') as file:
+        file.write(header.ljust(HEADER_SIZE, b'\0'))
+        _write_section(file, csr.offsets)
+        _write_section(file, csr.targets)
+        if csr.weights is not None:
+            _write_section(file, csr.weights)
+        file.write(labels)
+
+
+def load_graph(path):
+    """
+    Memory-map a file written by save_graph() and wrap it in a CSRGraph.
+
+    The offset / target / weight buffers are memoryviews straight into the
+    read-only mapping: nothing is copied and pages are read lazily, so several
+    processes loading the same file share one copy in the OS page cache.
+    A graph labelled 0..V-1 gets an IdentityInterner and loads in O(1) for
+    any size; otherwise the label table is decoded and indexed, which is O(V).
+
+    Args:
+        path: File written by save_graph()
+
+    Returns:
+        CSRGraph
+    """
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, flags, target_code, weight_code, num_vertices, num_edges, label_size = \
+        HEADER.unpack_from(mapping)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        mapping.close()
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} CSR graph file")
+
+    view = memoryview(mapping)
+    position = HEADER_SIZE
+    offsets, position = _read_section(view, position, 'q', num_vertices + 1)
+    targets, position = _read_section(view, position, target_code.decode(), num_edges)
+    weights = None
+    if weight_code != NO_WEIGHTS:
+        weights, position = _read_section(view, position, weight_code.decode(), num_edges)
+    if flags & IDENTITY_LABELS:
+        interner = IdentityInterner(num_vertices)
+    else:
+        interner = VertexInterner(json.loads(view[position:position + label_size].tobytes()))
+
+    csr = CSRGraph(interner.labels, offsets, targets, weights, bool(flags & DIRECTED), interner)
+    # the memoryviews keep the mapping alive, this just makes the owner explicit
+    csr.mapping = mapping
+    return csr
+
+
+def _identity_labels(labels):
+    # True if labels[i] == i for every id, bools and floats don't count
+    if isinstance(labels, range):
+        return labels.start == 0 and labels.step == 1
+    return all(type(label) is int and label == i for i, label in enumerate(labels))
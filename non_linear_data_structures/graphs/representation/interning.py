@@ -0,0 +1,83 @@
+from collections.abc import Mapping
+
+
+class VertexInterner:
+    """
+    Two-way mapping between arbitrary vertex labels and dense ids 0..n-1.
+
+    Algorithms that run on interned ids keep their per-vertex state in lists
+    or bytearrays indexed by id instead of dicts / sets keyed by label, so a
+    visit costs an index instead of hashing the label (often a string).
+    Labels are only translated back when results leave the algorithm.
+    """
+
+    def __init__(self, labels=()):
+        self.labels = []
+        self.index = {}
+        for label in labels:
+            self.intern(label)
+
+    def intern(self, label):
+        """Id of label, assigning the next free id the first time it is seen."""
+        vertex_id = self.index.get(label)
+        if vertex_id is None:
+            vertex_id = len(self.labels)
+            self.index[label] = vertex_id
+            self.labels.append(label)
+        return vertex_id
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    def ids(self, labels):
+        return [self.index[label] for label in labels]
+
+    def to_labels(self, ids):
+        return list(map(self.labels.__getitem__, ids))
+
+    def to_label_dict(self, values):
+        """{label: values[id]} for a list indexed by vertex id."""
+        return dict(zip(self.labels, values))
+
+
+class IdentityInterner(VertexInterner):
+    """
+    VertexInterner for graphs whose labels already are the ids 0..n-1.
+
+    labels is a range and index answers lookups arithmetically, so neither a
+    label list nor a dict is built: creating one is O(1) for any n. This is
+    what load_graph() uses for files saved from int-labelled graphs.
+    """
+
+    def __init__(self, n):
+        self.labels = range(n)
+        self.index = _IdentityIndex(n)
+
+    def intern(self, label):
+        if label not in self.index:
+            raise ValueError(f"{label!r} is not a vertex id in 0..{len(self.labels) - 1}")
+        return label
+
+
+class _IdentityIndex(Mapping):
+    # read-only {id: id} for 0..n-1 without storing it
+
+    def __init__(self, n):
+        self._n = n
+
+    def __getitem__(self, label):
+        if label in self:
+            return label
+        raise KeyError(label)
+
+    def __contains__(self, label):
+        return isinstance(label, int) and 0 <= label < self._n
+
+    def __iter__(self):
+        return iter(range(self._n))
+
+    def __len__(self):
+        return self._n
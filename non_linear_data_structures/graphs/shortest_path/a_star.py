@@ -0,0 +1,212 @@
+import heapq
+import math
+from itertools import count
+
+from ..representation.csr_graph import as_csr
+from .dijkstra import dijkstra
+
+def a_star(graph, start, end, heuristic=None):
+    """
+    A* search: Dijkstra ordered by distance so far plus an estimate of the rest.
+
+    heuristic(vertex, end) must never overestimate the remaining distance
+    (admissible) and should satisfy h(u) <= weight(u, v) + h(v) (consistent),
+    which all the heuristics in this module do. Then every vertex is settled
+    at most once and the returned path is a shortest one. The better the
+    estimate, the fewer vertices are settled off the direct route; without a
+    heuristic this is plain Dijkstra with early exit.
+
+    Time Complexity: O((V + E) log V) worst case
+    Space Complexity: O(vertices touched)
+
+    Args:
+        graph: Weighted graph with non-negative weights
+        start: Source vertex
+        end: Target vertex
+        heuristic: Callable (vertex, end) -> lower bound, e.g. euclidean_heuristic(),
+            haversine_heuristic() or LandmarkIndex(...).heuristic. None means 0
+
+    Returns:
+        tuple: (path, distance), or (None, float('inf')) if end is unreachable
+    """
+    if start not in graph.graph or end not in graph.graph:
+        return None, float('inf')
+    if heuristic is None:
+        heuristic = _zero_heuristic
+
+    distances = {start: 0}
+    predecessors = {start: None}
+    visited = set()
+    # the counter breaks ties so vertex labels are never compared
+    tie_breaker = count()
+    open_set = [(heuristic(start, end), next(tie_breaker), start)]
+
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if current in visited:
+            continue
+        if current == end:
+            path = []
+            vertex = end
+            while vertex is not None:
+                path.append(vertex)
+                vertex = predecessors[vertex]
+            return path[::-1], distances[end]
+        visited.add(current)
+
+        current_distance = distances[current]
+        for neighbor, weight in graph.graph[current]:
+            if neighbor in visited:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                estimate = heuristic(neighbor, end)
+                if estimate == float('inf'):
+                    # the heuristic proved end unreachable from neighbor
+                    continue
+                distances[neighbor] = distance
+                predecessors[neighbor] = current
+                heapq.heappush(open_set, (distance + estimate, next(tie_breaker), neighbor))
+
+    return None, float('inf')
+
+def _zero_heuristic(vertex, end):
+    return 0
+
+def euclidean_heuristic(coordinates, scale=1.0):
+    """
+    Straight-line distance between planar (x, y) coordinates.
+
+    Args:
+        coordinates: {vertex: (x, y)}
+        scale: Minimum edge weight per unit of straight-line distance. Keep it at
+            or below the real ratio (e.g. cost per meter at top speed for travel
+            times) or the estimate overestimates and paths may not be shortest
+
+    Returns:
+        Callable (vertex, end) -> scale * distance
+    """
+    def heuristic(vertex, end):
+        x1, y1 = coordinates[vertex]
+        x2, y2 = coordinates[end]
+        return scale * math.hypot(x2 - x1, y2 - y1)
+    return heuristic
+
+def haversine_heuristic(coordinates, radius=6371.0, scale=1.0):
+    """
+    Great-circle distance between (latitude, longitude) pairs in degrees.
+
+    Args:
+        coordinates: {vertex: (latitude, longitude)}
+        radius: Sphere radius, the default gives kilometers on Earth
+        scale: Minimum edge weight per unit of great-circle distance, see
+            euclidean_heuristic()
+
+    Returns:
+        Callable (vertex, end) -> scale * distance
+    """
+    # radians once instead of on every call
+    radians = {vertex: (math.radians(lat), math.radians(lon))
+               for vertex, (lat, lon) in coordinates.items()}
+
+    def heuristic(vertex, end):
+        lat1, lon1 = radians[vertex]
+        lat2, lon2 = radians[end]
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+        return scale * 2 * radius * math.asin(min(1.0, math.sqrt(a)))
+    return heuristic
+
+class LandmarkIndex:
+    """
+    ALT (A*, landmarks, triangle inequality) lower bounds.
+
+    Shortest distances from (and, for directed graphs, to) a few landmark
+    vertices are computed once with dijkstra(). For any landmark L the
+    triangle inequality gives
+        d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+    and the heuristic is the largest of these bounds. They are admissible and
+    consistent for any weights, unlike coordinates they also work for travel
+    times, and landmarks "behind" the target make the bound nearly tight.
+
+    Landmarks default to farthest-point selection: each new landmark is the
+    vertex farthest from the ones chosen so far, which spreads them along the
+    edge of the graph where they help most.
+
+    Build:    num_landmarks (2x for directed graphs) Dijkstra runs
+    Space:    O(V * num_landmarks)
+
+    Example:
+        landmarks = LandmarkIndex(roads, num_landmarks=8)
+        path, distance = a_star(roads, 'A', 'B', landmarks.heuristic)
+    """
+
+    def __init__(self, graph, landmarks=None, num_landmarks=8):
+        """
+        Args:
+            graph: Weighted graph with non-negative weights, must not change
+                afterwards (the bounds would become wrong)
+            landmarks: Landmark vertices to use, picked automatically when None
+            num_landmarks: Number of landmarks to pick
+        """
+        self.directed = graph.directed
+        reverse = None
+        if self.directed:
+            reverse = graph.transpose() if hasattr(graph, 'transpose') else as_csr(graph).transpose()
+
+        if landmarks is None:
+            self.landmarks, from_landmarks = self._pick_landmarks(graph, num_landmarks)
+        else:
+            self.landmarks = list(landmarks)
+            from_landmarks = [dijkstra(graph, landmark)[0] for landmark in self.landmarks]
+
+        # per vertex a tuple with one distance per landmark, zipped in heuristic()
+        self.from_landmarks = {vertex: tuple(distances[vertex] for distances in from_landmarks)
+                               for vertex in graph.graph}
+        self.to_landmarks = None
+        if self.directed:
+            to_landmarks = [dijkstra(reverse, landmark)[0] for landmark in self.landmarks]
+            self.to_landmarks = {vertex: tuple(distances[vertex] for distances in to_landmarks)
+                                 for vertex in graph.graph}
+
+    @staticmethod
+    def _pick_landmarks(graph, num_landmarks):
+        # farthest-point selection, returns the landmarks and their dijkstra() distances
+        vertices = list(graph.graph)
+        if not vertices:
+            return [], []
+        landmarks, runs = [], []
+        # start from the vertex farthest from an arbitrary one. Unreachable
+        # vertices count as farthest, so other components get landmarks too
+        nearest = dijkstra(graph, vertices[0])[0]
+        for _ in range(min(num_landmarks, len(vertices))):
+            chosen = set(landmarks)
+            landmark = max((v for v in vertices if v not in chosen), key=nearest.__getitem__)
+            distances = dijkstra(graph, landmark)[0]
+            landmarks.append(landmark)
+            runs.append(distances)
+            if len(runs) == 1:
+                nearest = dict(distances)
+            else:
+                for vertex in vertices:
+                    if distances[vertex] < nearest[vertex]:
+                        nearest[vertex] = distances[vertex]
+        return landmarks, runs
+
+    def heuristic(self, vertex, end):
+        """Lower bound on the distance from vertex to end."""
+        inf = float('inf')
+        bound = 0
+        # d(v, t) >= d(L, t) - d(L, v), and the mirrored bound when undirected
+        for from_vertex, from_end in zip(self.from_landmarks[vertex], self.from_landmarks[end]):
+            if from_vertex == inf or from_end == inf:
+                continue
+            difference = from_end - from_vertex if self.directed else abs(from_end - from_vertex)
+            if difference > bound:
+                bound = difference
+        if self.directed:
+            # d(v, t) >= d(v, L) - d(t, L)
+            for to_vertex, to_end in zip(self.to_landmarks[vertex], self.to_landmarks[end]):
+                if to_vertex != inf and to_end != inf and to_vertex - to_end > bound:
+                    bound = to_vertex - to_end
+        return bound
@@ -1,20 +1,59 @@
-def shortest_path(graph, start, end):
+import heapq
+from itertools import count
+
+from ..representation.csr_graph import as_csr
+
+def shortest_path(graph, start, end, bidirectional=False, reverse=None):
+    """
+    Shortest path between two vertices with non-negative edge weights.
+
+    The one-sided search is Dijkstra on a heap that stops as soon as end is
+    settled. With bidirectional=True a second search runs backward from end
+    (over graph.transpose() for directed graphs) and the two alternate, always
+    advancing the side with the smaller heap minimum. Every relaxed edge that
+    reaches a vertex labelled by the other side is a candidate path, and the
+    search stops once the two heap minimums add up to at least the best
+    candidate: no undiscovered path can be shorter. Each side then only has to
+    cover about half the distance, which settles far fewer vertices on large
+    graphs.
+
+    Only vertices the search touches get distance entries, so a short query
+    on a big graph doesn't pay O(V) setup.
+
+    graph.transpose() is O(1) with track_incoming=True or for a CSRGraph
+    (cached), but an O(V + E) copy otherwise, and snapshots are converted to
+    CSR first. Pass reverse to reuse one transpose across many queries.
+
+    Time Complexity: O((V + E) log V) worst case
+    Space Complexity: O(vertices touched)
+
+    Args:
+        graph: Weighted graph (list based, CSRGraph or snapshot)
+        start: Source vertex
+        end: Target vertex
+        bidirectional: Search from both ends
+        reverse: Optional precomputed graph.transpose() for the backward search
+
+    Returns:
+        tuple: (path, distance), or (None, float('inf')) if end is unreachable
+    """
     if start not in graph.graph or end not in graph.graph:
         return None, float('inf')
+    if bidirectional:
+        return _bidirectional_shortest_path(graph, start, end, reverse)
 
-    distances = {vertex: float('inf') for vertex in graph.graph}
-    distances[start] = 0
-    predecessors = {vertex: None for vertex in graph.graph}
-
-    pq = [(0, start)]
+    distances = {start: 0}
+    predecessors = {start: None}
     visited = set()
+    # the counter breaks distance ties so vertex labels are never compared
+    tie_breaker = count()
+    pq = [(0, next(tie_breaker), start)]
 
     while pq:
-        current_distance, current_vertex = min(pq)
-        pq.remove((current_distance, current_vertex))
+        current_distance, _, current_vertex = heapq.heappop(pq)
 
         if current_vertex == end:
-            break
+            return _walk_back(predecessors, end)[::-1], current_distance
 
         if current_vertex in visited:
             continue
@@ -27,18 +66,60 @@ def shortest_path(graph, start, end):
 
             distance = current_distance + weight
 
-            if distance < distances[neighbor]:
+            if distance < distances.get(neighbor, float('inf')):
                 distances[neighbor] = distance
                 predecessors[neighbor] = current_vertex
-                pq.append((distance, neighbor))
+                heapq.heappush(pq, (distance, next(tie_breaker), neighbor))
 
-    if distances[end] == float('inf'):
-        return None, float('inf')
+    return None, float('inf')
 
+def _walk_back(predecessors, vertex):
     path = []
-    current = end
-    while current is not None:
-        path.append(current)
-        current = predecessors[current]
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    return path
+
+def _bidirectional_shortest_path(graph, start, end, reverse=None):
+    if start == end:
+        return [start], 0
+    if reverse is None:
+        if not hasattr(graph, 'transpose'):
+            # snapshots have no reverse adjacency, the CSR form builds one
+            graph = as_csr(graph)
+        reverse = graph.transpose()
+
+    # index 0 is the forward search from start, 1 the backward one from end
+    adjacency = (graph.graph, reverse.graph)
+    distances = ({start: 0}, {end: 0})
+    predecessors = ({start: None}, {end: None})
+    settled = (set(), set())
+    tie_breaker = count()
+    heaps = ([(0, next(tie_breaker), start)], [(0, next(tie_breaker), end)])
 
-    return path[::-1], distances[end]
+    best, meeting = float('inf'), None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_distance, _, current_vertex = heapq.heappop(heaps[side])
+        if current_vertex in settled[side]:
+            continue
+        settled[side].add(current_vertex)
+
+        own, other = distances[side], distances[1 - side]
+        for neighbor, weight in adjacency[side][current_vertex]:
+            distance = current_distance + weight
+            if distance < own.get(neighbor, float('inf')):
+                own[neighbor] = distance
+                predecessors[side][neighbor] = current_vertex
+                heapq.heappush(heaps[side], (distance, next(tie_breaker), neighbor))
+            if neighbor in other and own[neighbor] + other[neighbor] < best:
+                best = own[neighbor] + other[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return None, float('inf')
+    path = _walk_back(predecessors[0], meeting)[::-1]
+    path.extend(_walk_back(predecessors[1], predecessors[1][meeting]))
+    return path, best
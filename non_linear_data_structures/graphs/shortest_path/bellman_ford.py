@@ -1,9 +1,20 @@
+from collections import deque
+
+from ..representation.interning import VertexInterner
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def bellman_ford(graph, start):
     """
     Bellman-Ford algorithm for finding shortest paths from a source vertex to all other vertices.
     Can handle negative edge weights and detect negative cycles.
     
-    Time Complexity: O(VE)
+    Stops early once a pass changes nothing, since later passes couldn't either.
+    
+    Time Complexity: O(VE), O(kE) when the distances settle after k passes
     Space Complexity: O(V)
     
     Args:
@@ -26,13 +37,20 @@ def bellman_ford(graph, start):
     
     # Relax edges |V| - 1 times
     V = len(graph.graph)
-    edges = graph.get_edges()
+    # cached by the graph, so repeated runs on an unchanged graph skip rebuilding it
+    edges = graph.edge_array()
     
     for _ in range(V - 1):
+        updated = False
         for u, v, weight in edges:
             if distances[u] != float('inf') and distances[u] + weight < distances[v]:
                 distances[v] = distances[u] + weight
                 predecessors[v] = u
+                updated = True
+        if not updated:
+            # a pass without updates means every distance is final and there is
+            # no negative cycle, the check below would find nothing either
+            return distances, predecessors, False
     
     # Check for negative cycles
     has_negative_cycle = False
@@ -43,6 +61,182 @@ def bellman_ford(graph, start):
     
     return distances, predecessors, has_negative_cycle
 
+def spfa(graph, start):
+    """
+    Queue-based Bellman-Ford (Shortest Path Faster Algorithm).
+
+    Instead of relaxing every edge in every pass, only the out-edges of
+    vertices whose distance just changed are relaxed, and the run ends as
+    soon as the queue is empty. On sparse graphs with mostly positive weights
+    that is close to linear. A negative cycle is detected when some shortest
+    path would need V or more edges, and it is then walked back through the
+    predecessors and returned.
+
+    The adjacency is used directly, so an undirected edge is relaxed both ways
+    (a negative undirected edge is therefore a negative cycle u -> v -> u).
+
+    Time Complexity: O(VE) worst case, about O(E) on typical sparse graphs
+    Space Complexity: O(V)
+
+    Args:
+        graph: WeightedGraph instance
+        start: Starting vertex
+
+    Returns:
+        tuple: (distances, predecessors, negative_cycle)
+            - distances / predecessors: as in bellman_ford()
+            - negative_cycle: [v0, v1, ..., v0] following the edges of a negative
+              cycle reachable from start, or None, so it can be tested like
+              bellman_ford()'s has_negative_cycle
+    """
+    if start not in graph.graph:
+        return None, None, None
+
+    distances = {vertex: float('inf') for vertex in graph.graph}
+    distances[start] = 0
+    predecessors = {vertex: None for vertex in graph.graph}
+    # edges on the current shortest path to each vertex
+    edge_count = {start: 0}
+    V = len(graph.graph)
+
+    queue = deque([start])
+    in_queue = {start}
+
+    while queue:
+        u = queue.popleft()
+        in_queue.discard(u)
+        distance_u = distances[u]
+
+        for v, weight in graph.graph[u]:
+            if distance_u + weight < distances[v]:
+                distances[v] = distance_u + weight
+                predecessors[v] = u
+                edge_count[v] = edge_count[u] + 1
+                if edge_count[v] >= V:
+                    # a simple path has at most V - 1 edges, this one repeats a vertex.
+                    # The counts can run ahead of the predecessor links, so keep going
+                    # in the rare case the cycle isn't closed in them yet
+                    cycle = _extract_cycle(predecessors, v)
+                    if cycle is not None:
+                        return distances, predecessors, cycle
+                if v not in in_queue:
+                    queue.append(v)
+                    in_queue.add(v)
+
+    return distances, predecessors, None
+
+def _extract_cycle(predecessors, vertex):
+    # walk back until a vertex repeats, the part from its first visit is the cycle
+    position = {}
+    walk = []
+    while vertex is not None and vertex not in position:
+        position[vertex] = len(walk)
+        walk.append(vertex)
+        vertex = predecessors[vertex]
+    if vertex is None:
+        return None
+    cycle = walk[position[vertex]:]
+    cycle.reverse()
+    cycle.append(cycle[0])
+    return cycle
+
+def edge_arrays(graph):
+    """
+    The edges bellman_ford() relaxes as NumPy arrays over dense vertex ids.
+
+    Build it once and pass it to bellman_ford_vectorized() for every source
+    on an unchanged graph. Directed CSRGraphs are converted without a Python
+    level loop, other graphs go through graph.edge_array().
+
+    Returns:
+        tuple: (interner, sources, targets, weights) with interner the
+            VertexInterner of the ids (interner.labels[i] is the vertex of
+            id i), int64 id arrays and float64 weights
+    """
+    if np is None:
+        raise ImportError("NumPy is required for edge_arrays()")
+
+    if getattr(graph, 'interner', None) is not None and graph.directed and graph.weights is not None:
+        offsets, targets, weights = graph.as_numpy()
+        sources = np.repeat(np.arange(len(graph.interner), dtype=np.int64), np.diff(offsets))
+        return graph.interner, sources, targets.astype(np.int64), weights.astype(np.float64)
+
+    interner = VertexInterner(graph.graph)
+    index = interner.index
+    edges = graph.edge_array()
+    count = len(edges)
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=count)
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=count)
+    weights = np.fromiter((weight for _, _, weight in edges), dtype=np.float64, count=count)
+    return interner, sources, targets, weights
+
+def bellman_ford_vectorized(graph, start, edges=None):
+    """
+    bellman_ford() with every relaxation round done as NumPy array operations.
+
+    A round computes all candidates dist[source] + weight at once, keeps the
+    ones that improve their target, and scatters them with np.minimum.at (the
+    minimum wins when several edges hit the same vertex). The predecessor of
+    each improved vertex is an edge whose candidate equals the new minimum.
+    Rounds use the distances of the previous round, so after k rounds all
+    shortest paths of at most k edges are final, as in the classic proof, and
+    the run stops at the first round without improvements.
+
+    Distances are computed in float64, integer weights beyond 2**53 lose
+    precision. Falls back to bellman_ford() when NumPy isn't installed.
+
+    Time Complexity: O(VE) worst case, O(kE) in C for k rounds
+    Space Complexity: O(V + E)
+
+    Args:
+        graph: WeightedGraph instance (or CSRGraph)
+        start: Starting vertex
+        edges: Optional edge_arrays(graph), reused across calls
+
+    Returns:
+        tuple: (distances, predecessors, has_negative_cycle) like bellman_ford()
+    """
+    if np is None:
+        return bellman_ford(graph, start)
+    if start not in graph.graph:
+        return None, None, False
+
+    interner, sources, targets, weights = edge_arrays(graph) if edges is None else edges
+    labels = interner.labels
+    n = len(labels)
+    source = interner.index.get(start)
+    if source is None:
+        # edges built before start was added to the graph
+        return None, None, False
+
+    distances = np.full(n, np.inf)
+    distances[source] = 0.0
+    predecessors = np.full(n, -1, dtype=np.int64)
+
+    has_negative_cycle = False
+    for round_number in range(n):
+        candidates = distances[sources] + weights
+        improving = candidates < distances[targets]
+        if not improving.any():
+            break
+        if round_number == n - 1:
+            # V - 1 rounds done and still improving: negative cycle
+            has_negative_cycle = True
+            break
+
+        improved_targets = targets[improving]
+        improved_candidates = candidates[improving]
+        np.minimum.at(distances, improved_targets, improved_candidates)
+        winners = improved_candidates == distances[improved_targets]
+        predecessors[improved_targets[winners]] = sources[improving][winners]
+
+    distance_values = distances.tolist()
+    predecessor_ids = predecessors.tolist()
+    return (interner.to_label_dict(distance_values),
+            {label: None if predecessor_ids[i] < 0 else labels[predecessor_ids[i]]
+             for i, label in enumerate(labels)},
+            has_negative_cycle)
+
 def get_shortest_path_bellman_ford(predecessors, end):
     """
     Reconstruct the shortest path from the start vertex to the end vertex.
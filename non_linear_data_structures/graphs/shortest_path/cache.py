@@ -0,0 +1,125 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+from .dijkstra import dijkstra, get_shortest_path
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'invalidations', 'maxsize', 'currsize'])
+
+
+class ShortestPathCache:
+    """
+    LRU cache of dijkstra() single-source results for one graph.
+
+    Query traffic is usually skewed towards a few sources, and every dijkstra()
+    run computes the full shortest path tree of its source, so keeping the
+    trees of recently used sources answers most queries with a dict lookup.
+
+    Entries are valid for one graph.version. Every add_vertex / add_edge /
+    remove_vertex / remove_edge bumps the version, and the next lookup drops
+    all cached trees before recomputing, so a result never outlives the graph
+    it was computed on. At most maxsize trees (O(V) each) are kept, the least
+    recently used one is evicted first.
+
+    Lookups are thread-safe. The tree itself is computed outside the lock, so
+    two threads missing on the same source may both run dijkstra().
+
+    Hit:  O(1)
+    Miss: one dijkstra() run, O((V + E) log V)
+    Space: O(maxsize * V)
+
+    Example:
+        routes = ShortestPathCache(roads, maxsize=256)
+        path, distance = routes.path('A', 'B')
+        routes.cache_info()    # CacheInfo(hits=..., misses=..., evictions=..., ...)
+    """
+
+    def __init__(self, graph, maxsize=128):
+        """
+        Args:
+            graph: Weighted graph with non-negative weights and a version
+                attribute (list based graphs, CSRGraph, snapshots)
+            maxsize: Number of single-source trees to keep, at least 1
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.graph = graph
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # trees dropped because the graph changed, not because the cache was full
+        self.invalidations = 0
+        # source -> (distances, predecessors), least recently used first
+        self._entries = OrderedDict()
+        self._version = graph.version
+        self._lock = threading.Lock()
+
+    def single_source(self, source):
+        """
+        dijkstra(graph, source) through the cache.
+
+        The returned dicts are shared with the cache and must not be modified.
+
+        Returns:
+            tuple: (distances, predecessors) as returned by dijkstra()
+        """
+        version = self.graph.version
+        with self._lock:
+            if version != self._version:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(source)
+            if entry is not None:
+                self._entries.move_to_end(source)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = dijkstra(self.graph, source)
+
+        with self._lock:
+            # a change while dijkstra() ran makes the tree stale before it is stored
+            if self.graph.version == version == self._version:
+                self._entries[source] = entry
+                self._entries.move_to_end(source)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return entry
+
+    def distances(self, source):
+        """Shortest distances from source, {vertex: distance}."""
+        return self.single_source(source)[0]
+
+    def distance(self, source, target):
+        """Shortest distance from source to target, float('inf') if unreachable."""
+        return self.single_source(source)[0].get(target, float('inf'))
+
+    def path(self, source, target):
+        """
+        Shortest path from source to target.
+
+        Returns:
+            tuple: (path, distance), or (None, float('inf')) if target is unreachable
+        """
+        distances, predecessors = self.single_source(source)
+        distance = distances.get(target, float('inf'))
+        if distance == float('inf'):
+            return None, distance
+        return get_shortest_path(predecessors, target), distance
+
+    def cache_info(self):
+        """Counters in the style of functools.lru_cache().cache_info()."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.invalidations,
+                             self.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        """Drop every cached tree and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
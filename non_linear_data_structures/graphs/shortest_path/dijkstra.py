@@ -1,28 +1,105 @@
-def dijkstra(graph, source):
+import heapq
+from itertools import count
+
+def dijkstra(graph, source, target=None, max_distance=None):
+    """
+    Dijkstra's single-source shortest paths with a binary heap (heapq).
+
+    Instead of a decrease-key, an improved distance pushes a new heap entry and
+    stale entries (popped after their vertex was settled) are skipped, so the
+    heap holds at most E entries.
+
+    Time Complexity: O((V + E) log V)
+    Space Complexity: O(V + E)
+
+    Args:
+        graph: Weighted graph with non-negative weights
+        source: Starting vertex
+        target: Stop as soon as this vertex is settled. Its distance and path are
+            final, other distances may then still be upper bounds
+        max_distance: Don't settle vertices farther than this, they stay at
+            float('inf')
+
+    Returns:
+        tuple: (distances, predecessors) dicts over all vertices, unreached
+            vertices have distance float('inf') and predecessor None. A source
+            outside the graph only gets its own distance 0
+    """
+    if getattr(graph, 'interner', None) is not None and source in graph.interner:
+        return _dijkstra_interned(graph, source, target, max_distance)
+
     distances = {vertex: float('inf') for vertex in graph.graph}
     distances[source] = 0
     predecessors = {vertex: None for vertex in graph.graph}
+    if source not in graph.graph:
+        # nothing is reachable from a vertex outside the graph, as in the original version
+        return distances, predecessors
 
-    unvisited = set(graph.graph.keys())
-
-    while unvisited:
-        current = min(unvisited, key=lambda vertex: distances[vertex])
+    visited = set()
+    # the counter breaks ties so vertex labels never have to be comparable
+    tie_breaker = count()
+    heap = [(0, next(tie_breaker), source)]
 
-        if distances[current] == float('inf'):
+    while heap:
+        current_distance, _, current = heapq.heappop(heap)
+        if current in visited:
+            continue
+        visited.add(current)
+        if current == target:
             break
 
-        unvisited.remove(current)
-
         for neighbor, weight in graph.graph[current]:
-            if neighbor in unvisited:
-                distance = distances[current] + weight
+            if neighbor not in visited:
+                distance = current_distance + weight
+                if max_distance is not None and distance > max_distance:
+                    continue
 
                 if distance < distances[neighbor]:
                     distances[neighbor] = distance
                     predecessors[neighbor] = current
+                    heapq.heappush(heap, (distance, next(tie_breaker), neighbor))
 
     return distances, predecessors
 
+def _dijkstra_interned(graph, source, target=None, max_distance=None):
+    # same algorithm with list-indexed state over the ids of an interned graph,
+    # ids are ints so heap entries need no tie breaker
+    interner = graph.interner
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(interner)
+
+    distances = [float('inf')] * n
+    predecessors = [None] * n
+    start = interner.index[source]
+    stop = interner.index.get(target, -1) if target is not None else -1
+    distances[start] = 0
+    visited = bytearray(n)
+    heap = [(0, start)]
+
+    while heap:
+        current_distance, current = heapq.heappop(heap)
+        if visited[current]:
+            continue
+        visited[current] = 1
+        if current == stop:
+            break
+
+        for position in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[position]
+            if not visited[neighbor]:
+                distance = current_distance + weights[position]
+                if max_distance is not None and distance > max_distance:
+                    continue
+
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current
+                    heapq.heappush(heap, (distance, neighbor))
+
+    labels = interner.labels
+    return (interner.to_label_dict(distances),
+            interner.to_label_dict([None if p is None else labels[p] for p in predecessors]))
+
 def get_shortest_path(predecessors, target):
     path = []
     current = target
@@ -0,0 +1,188 @@
+import heapq
+import os
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from ..representation.csr_graph import CSRGraph, as_csr, buffer_typecode
+from .bellman_ford import bellman_ford
+
+# below this many vertices a pool costs more to start than it saves
+MIN_PARALLEL_VERTICES = 256
+
+
+class _VirtualSource:
+    """Label of the extra vertex Bellman-Ford starts from, never equal to a real vertex."""
+
+    def __repr__(self):
+        return '<virtual source>'
+
+
+def johnson(graph, processes=None):
+    """
+    Johnson's all-pairs shortest paths for sparse graphs with negative weights.
+
+    The graph is reweighted once: Bellman-Ford from a virtual source joined to
+    every vertex by a 0 edge gives potentials h(v) <= 0, and
+    w'(u, v) = w(u, v) + h(u) - h(v) is never negative while every path from
+    s to t changes by the same h(s) - h(t). Then a heap-based Dijkstra runs
+    from every source and the distances are shifted back.
+
+    The Dijkstra runs are spread over a process pool. The reweighted CSR
+    buffers are copied once into shared memory that every worker maps
+    read-only, so the graph is neither pickled per task nor duplicated per
+    process. Rows come back one source at a time, so the V x V result never
+    has to be held in memory (see also johnson_to_file()).
+
+    Undirected edges count in both directions, so a negative undirected edge
+    is a negative cycle.
+
+    Time Complexity: O(VE) reweighting + O(V (V + E) log V) / processes
+    Space Complexity: O(V + E) shared, plus O(V) per row in flight
+
+    Args:
+        graph: Weighted graph (list based, CSRGraph or snapshot), edges of an
+            unweighted graph count as weight 1
+        processes: Worker processes, defaults to os.cpu_count(). 1 (or a graph
+            with fewer than MIN_PARALLEL_VERTICES vertices) runs in this process
+
+    Returns:
+        Iterator of (source, distances) pairs in vertex order, distances being
+        {vertex: distance} with float('inf') for unreachable vertices
+
+    Raises:
+        ValueError: If the graph contains a negative cycle (raised here, before
+            the first row is produced)
+    """
+    csr, weights, potentials = _reweight(graph)
+    labels = csr.labels
+    rows = _rows(csr, weights, potentials, processes)
+    return ((labels[source], csr.interner.to_label_dict(row)) for source, row in enumerate(rows))
+
+def johnson_to_file(graph, path, processes=None):
+    """
+    Write the johnson() distance matrix to disk row by row.
+
+    The file is V * V native float64 values in row-major order, row i holding
+    the distances from vertex labels[i]. It can be mapped back without reading
+    it into memory, e.g. np.memmap(path, dtype=np.float64, shape=(V, V)) or
+    memoryview(mmap_object).cast('d').
+
+    Args:
+        graph: Weighted graph (list based, CSRGraph or snapshot)
+        path: Output file path
+        processes: Worker processes, see johnson()
+
+    Returns:
+        list: labels, labels[i] is the vertex of row and column i
+
+    Raises:
+        ValueError: If the graph contains a negative cycle
+    """
+    csr, weights, potentials = _reweight(graph)
+    with open(path, 'wb') as file:
+        for row in _rows(csr, weights, potentials, processes):
+            row.tofile(file)
+    return list(csr.labels)
+
+def _reweight(graph):
+    # (csr, reweighted float weights, potentials) with weights parallel to csr.targets
+    csr = as_csr(graph)
+    n, m = csr.num_vertices(), csr.num_edges()
+    # unweighted CSR graphs have no weights buffer, their edges weigh 1 as in get_weight()
+    original = csr.weights if csr.weights is not None else array('q', [1]) * m
+
+    # directed copy with the virtual source as an extra last vertex. Edges are
+    # taken as stored, so an undirected edge becomes two directed ones
+    virtual = _VirtualSource()
+    offsets = array('q', csr.offsets)
+    offsets.append(m + n)
+    targets = array(buffer_typecode(csr.targets), csr.targets)
+    targets.extend(range(n))
+    weights = array(buffer_typecode(original), original)
+    weights.extend([0] * n)
+    extended = CSRGraph(list(csr.labels) + [virtual], offsets, targets, weights, directed=True)
+
+    distances, _, has_negative_cycle = bellman_ford(extended, virtual)
+    if has_negative_cycle:
+        raise ValueError("Graph contains a negative cycle")
+
+    potentials = array('d', (distances[label] for label in csr.labels))
+    reweighted = array('d', bytes(8 * m))
+    for source in range(n):
+        shift = potentials[source]
+        for position in range(csr.offsets[source], csr.offsets[source + 1]):
+            # >= 0 up to float rounding, which must not turn into a negative edge
+            reweighted[position] = max(0.0, original[position] + shift - potentials[csr.targets[position]])
+    return csr, reweighted, potentials
+
+def _rows(csr, weights, potentials, processes):
+    # distance rows (array('d') over vertex ids) in source order
+    n = csr.num_vertices()
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes <= 1 or n < MIN_PARALLEL_VERTICES:
+        for source in range(n):
+            yield _dijkstra_row(csr.offsets, csr.targets, weights, potentials, source)
+        return
+
+    buffers = [array('q', csr.offsets), csr.targets, weights, potentials]
+    segments = []
+    try:
+        for buffer in buffers:
+            data = memoryview(buffer).cast('B')
+            # a segment can't be empty, e.g. the targets of an edgeless graph
+            segment = SharedMemory(create=True, size=max(1, len(data)))
+            segment.buf[:len(data)] = data
+            segments.append(segment)
+        layout = [(segment.name, buffer_typecode(buffer), len(buffer))
+                  for segment, buffer in zip(segments, buffers)]
+
+        with Pool(processes, initializer=_attach, initargs=(layout,)) as pool:
+            # ordered imap keeps rows in source order, a few chunks per worker
+            # balance uneven sources without a round trip per row
+            chunksize = max(1, n // (processes * 8))
+            yield from pool.imap(_pool_row, range(n), chunksize)
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+# worker state set by _attach(): the shared segments and (offsets, targets, weights, potentials) views
+_segments = None
+_shared = None
+
+def _attach(layout):
+    global _segments, _shared
+    _segments = [SharedMemory(name=name) for name, _, _ in layout]
+    _shared = [segment.buf[:length * array(typecode).itemsize].cast(typecode)
+               for segment, (_, typecode, length) in zip(_segments, layout)]
+
+def _pool_row(source):
+    return _dijkstra_row(*_shared, source)
+
+def _dijkstra_row(offsets, targets, weights, potentials, source):
+    # Dijkstra over the reweighted ids, shifted back to the original weights
+    n = len(potentials)
+    distances = [float('inf')] * n
+    distances[source] = 0.0
+    visited = bytearray(n)
+    heap = [(0.0, source)]
+
+    while heap:
+        current_distance, current = heapq.heappop(heap)
+        if visited[current]:
+            continue
+        visited[current] = 1
+
+        for position in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[position]
+            if not visited[neighbor]:
+                distance = current_distance + weights[position]
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    heapq.heappush(heap, (distance, neighbor))
+
+    shift = potentials[source]
+    return array('d', (distance - shift + potentials[vertex] if visited[vertex] else distance
+                       for vertex, distance in enumerate(distances)))
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# the tests import the package as `graphs`, like the demonstrations run from
+# the non_linear_data_structures directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
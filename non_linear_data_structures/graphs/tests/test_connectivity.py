@@ -0,0 +1,30 @@
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from graphs.connectivity.connected_components import IncrementalComponents, connected_components
+
+
+def test_incremental_components_follow_add_edges_from():
+    graph = UnweightedGraph()
+    graph.add_edge('a', 'b')
+    components = IncrementalComponents(graph)
+    graph.add_edges_from([('b', 'c'), ('x', 'y')])
+    assert components.same_component('a', 'c')
+    assert components.same_component('x', 'y')
+    assert not components.same_component('a', 'x')
+    assert components.num_components() == 2
+
+
+def test_connected_components_on_tuple_labels():
+    graph = UnweightedGraph()
+    for i in range(3):
+        graph.add_edge((i, 0), (i, 1))
+    graph.add_edge((0, 1), (1, 0))
+    components = sorted(sorted(component) for component in connected_components(graph))
+    assert components == [[(0, 0), (0, 1), (1, 0), (1, 1)], [(2, 0), (2, 1)]]
+
+
+def test_connected_components_on_weighted_graph():
+    graph = WeightedGraph()
+    graph.add_edge('a', 'b', 3)
+    graph.add_edge('c', 'd', 1)
+    components = sorted(sorted(component) for component in connected_components(graph))
+    assert components == [['a', 'b'], ['c', 'd']]
@@ -0,0 +1,17 @@
+import pytest
+
+from graphs.representation.edge_list_reader import read_edge_chunks
+
+
+def test_chunks_are_bounded(tmp_path):
+    path = tmp_path / 'edges.csv'
+    path.write_text('a,b,1\nb,c,2\nc,d,3\n')
+    assert [len(chunk) for chunk in read_edge_chunks(str(path), chunk_size=2)] == [2, 1]
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_chunk_size_below_one_is_rejected(tmp_path, chunk_size):
+    path = tmp_path / 'edges.csv'
+    path.write_text('a,b,1\n')
+    with pytest.raises(ValueError):
+        read_edge_chunks(str(path), chunk_size=chunk_size)
@@ -0,0 +1,32 @@
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from graphs.minimum_spanning_tree.kruskal import kruskals_mst, kruskals_mst_union_find
+from graphs.representation.csr_graph import CSRGraph
+
+
+def mixed_label_graph():
+    graph = WeightedGraph()
+    graph.add_edge(1, 'a', 2)
+    graph.add_edge('a', 'b', 1)
+    return graph
+
+
+def test_kruskal_on_mixed_labels():
+    graph = mixed_label_graph()
+    expected = ([('a', 'b', 1), (1, 'a', 2)], 3)
+    assert kruskals_mst_union_find(graph) == expected
+    assert kruskals_mst(graph.graph) == expected
+
+
+def test_iter_edges_on_mixed_labels():
+    graph = mixed_label_graph()
+    graph.add_edge((0, 0), (0, 0), 5)
+    expected = [(1, 'a', 2), ('a', 'b', 1), ((0, 0), (0, 0), 5)]
+    assert list(graph.iter_edges()) == expected
+    assert list(graph.snapshot().iter_edges()) == expected
+    assert list(CSRGraph.from_graph(graph).iter_edges()) == expected
+
+    unweighted = UnweightedGraph()
+    unweighted.add_edge(1, 'a')
+    unweighted.add_edge('a', 'b')
+    assert list(unweighted.iter_edges()) == [(1, 'a'), ('a', 'b')]
+    assert list(unweighted.snapshot().iter_edges()) == [(1, 'a'), ('a', 'b')]
@@ -0,0 +1,190 @@
+import random
+
+import pytest
+
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph, iter_neighbors
+from graphs.representation.csr_graph import CSRGraph, as_csr
+
+
+def grid_graph(rows, columns, directed=False):
+    graph = UnweightedGraph(directed=directed)
+    for r in range(rows):
+        for c in range(columns):
+            graph.add_vertex((r, c))
+            if r:
+                graph.add_edge((r - 1, c), (r, c))
+            if c:
+                graph.add_edge((r, c - 1), (r, c))
+    return graph
+
+
+def test_iter_neighbors_keeps_tuple_labels():
+    graph = grid_graph(2, 2)
+    assert sorted(iter_neighbors(graph, (0, 0))) == [(0, 1), (1, 0)]
+
+
+def test_iter_neighbors_drops_weights():
+    graph = WeightedGraph()
+    graph.add_edge('a', 'b', 3)
+    graph.add_edge('a', 'c', 4)
+    assert list(iter_neighbors(graph, 'a')) == ['b', 'c']
+
+
+def test_csr_of_tuple_labelled_unweighted_graph():
+    graph = grid_graph(3, 3)
+    csr = CSRGraph.from_graph(graph)
+    assert csr.weights is None
+    assert sorted(csr.graph[(1, 1)]) == [(0, 1), (1, 0), (1, 2), (2, 1)]
+
+
+def test_csr_of_edgeless_weighted_graph_is_weighted():
+    graph = WeightedGraph()
+    graph.add_vertex('a')
+    graph.add_vertex('b')
+    csr = as_csr(graph)
+    assert csr.weighted
+    assert len(csr.weights) == 0
+
+
+def test_csr_of_transposed_view_keeps_weights():
+    graph = WeightedGraph(directed=True, track_incoming=True)
+    graph.add_edge('a', 'b', 5)
+    csr = CSRGraph.from_graph(graph.transpose())
+    assert csr.graph['b'] == [('a', 5)]
+
+
+def random_edges(count, vertices, seed=0, weighted=True):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 9)) for _ in range(count)]
+    return edges if weighted else [(vertex1, vertex2) for vertex1, vertex2, _ in edges]
+
+
+def same_graph(graph1, graph2):
+    assert list(graph1.graph) == list(graph2.graph)
+    for vertex in graph1.graph:
+        assert list(graph1.graph[vertex]) == list(graph2.graph[vertex])
+    if graph1._incoming is not None:
+        assert {v: list(p.items()) for v, p in graph1._incoming.items()} == \
+               {v: list(p.items()) for v, p in graph2._incoming.items()}
+        assert {v: list(p) for v, p in graph1._incoming_views.items()} == \
+               {v: list(p) for v, p in graph2._incoming_views.items()}
+
+
+def edge_loop(cls, edges, directed, track_incoming):
+    graph = cls(directed, track_incoming)
+    for edge in edges:
+        graph.add_edge(*edge)
+    return graph
+
+
+@pytest.mark.parametrize('cls, weighted', [(WeightedGraph, True), (UnweightedGraph, False)])
+@pytest.mark.parametrize('directed, track_incoming', [(False, False), (True, False), (True, True)])
+def test_bulk_loading_matches_add_edge(cls, weighted, directed, track_incoming):
+    edges = random_edges(500, 60, weighted=weighted)
+    expected = edge_loop(cls, edges, directed, track_incoming)
+    same_graph(cls.from_edge_list(edges, directed, track_incoming), expected)
+    same_graph(cls.from_edge_list(iter(edges), directed, track_incoming), expected)
+
+
+@pytest.mark.parametrize('cls, weighted', [(WeightedGraph, True), (UnweightedGraph, False)])
+@pytest.mark.parametrize('directed, track_incoming', [(False, False), (True, False), (True, True)])
+def test_from_numpy_arrays_matches_add_edge(cls, weighted, directed, track_incoming):
+    np = pytest.importorskip('numpy')
+    edges = random_edges(500, 60, weighted=weighted)
+    expected = edge_loop(cls, edges, directed, track_incoming)
+    columns = [np.array(column) for column in zip(*edges)]
+    graph = cls.from_arrays(*columns, directed=directed, track_incoming=track_incoming)
+    same_graph(graph, expected)
+    assert graph.version == 1
+    labels = [np.array([str(v) for v in column]) for column in zip(*edges)][:2]
+    graph = cls.from_arrays(*labels, directed=directed, track_incoming=track_incoming)
+    assert sorted(graph.graph) == sorted({str(v) for edge in edges for v in edge[:2]})
+
+
+def test_add_edges_from_bumps_version_and_notifies_once():
+    graph = UnweightedGraph()
+    graph.add_edge('a', 'b')
+    events = []
+    graph.add_listener(lambda event, vertex1, vertex2: events.append(event))
+    version = graph.version
+    graph.add_edges_from([('b', 'c'), ('d', 'e')])
+    assert graph.version == version + 1
+    assert events == ['add_edges']
+
+
+def test_add_edges_from_after_snapshot_leaves_snapshot_alone():
+    graph = WeightedGraph()
+    graph.add_edge('a', 'b', 1)
+    snapshot = graph.snapshot()
+    graph.add_edges_from([('a', 'c', 2), ('b', 'd', 3)])
+    assert list(snapshot.graph) == ['a', 'b']
+    assert list(snapshot.graph['a']) == [('b', 1)]
+    assert list(graph.graph['a']) == [('b', 1), ('c', 2)]
+
+
+def round_trip_graphs():
+    rng = random.Random(11)
+    weighted = WeightedGraph(directed=True)
+    floats = WeightedGraph()
+    unweighted = UnweightedGraph()
+    for vertex in range(40):
+        weighted.add_vertex(vertex)
+        floats.add_vertex(f'v{vertex}')
+        unweighted.add_vertex(vertex)
+    for _ in range(120):
+        u, v = rng.randrange(40), rng.randrange(40)
+        if u != v:
+            weighted.add_edge(u, v, rng.randint(1, 9))
+            floats.add_edge(f'v{u}', f'v{v}', rng.random() * 10)
+            unweighted.add_edge(u, v)
+    edgeless = WeightedGraph()
+    edgeless_unweighted = UnweightedGraph(directed=True)
+    for vertex in 'abc':
+        edgeless.add_vertex(vertex)
+        edgeless_unweighted.add_vertex(vertex)
+    return {'weighted': weighted, 'floats': floats, 'unweighted': unweighted,
+            'edgeless': edgeless, 'edgeless_unweighted': edgeless_unweighted}
+
+
+@pytest.mark.parametrize('name', sorted(round_trip_graphs()))
+def test_graph_file_round_trip(name, tmp_path):
+    from graphs.representation.graph_file import load_graph, save_graph
+    from graphs.shortest_path.dijkstra import dijkstra
+    from graphs.traversal.bfs_list_graph import bfs, bfs_level_order
+
+    graph = round_trip_graphs()[name]
+    save_graph(graph, tmp_path / 'graph.csr')
+    loaded = load_graph(tmp_path / 'graph.csr')
+    assert list(loaded.labels) == list(graph.graph)
+    assert loaded.directed == graph.directed and loaded.weighted == graph.weighted
+    assert sorted(map(repr, loaded.iter_edges())) == sorted(map(repr, graph.iter_edges()))
+    for source in list(graph.graph)[::7]:
+        if graph.weighted:
+            assert dijkstra(loaded, source)[0] == dijkstra(graph, source)[0]
+        else:
+            assert bfs(loaded, source) == bfs(graph, source)
+            assert bfs_level_order(loaded, source) == bfs_level_order(graph, source)
+
+
+def test_graph_file_rejects_tuple_labels(tmp_path):
+    from graphs.representation.graph_file import save_graph
+
+    with pytest.raises(TypeError):
+        save_graph(grid_graph(2, 2), tmp_path / 'grid.csr')
+
+
+def test_graph_file_identity_labels_skip_the_table(tmp_path):
+    from graphs.representation.graph_file import load_graph, save_graph
+    from graphs.representation.interning import IdentityInterner
+
+    graph = round_trip_graphs()['weighted']
+    save_graph(graph, tmp_path / 'ids.csr')
+    loaded = load_graph(tmp_path / 'ids.csr')
+    assert isinstance(loaded.interner, IdentityInterner)
+    assert 39 in loaded.graph and 40 not in loaded.graph and '1' not in loaded.graph
+    assert loaded.get_weight(*next(iter(graph.iter_edges()))[:2]) is not None
+
+    # a label that is an int but not its own id keeps the table
+    graph.add_vertex(100)
+    save_graph(graph, tmp_path / 'labels.csr')
+    assert not isinstance(load_graph(tmp_path / 'labels.csr').interner, IdentityInterner)
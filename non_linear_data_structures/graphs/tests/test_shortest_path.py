@@ -0,0 +1,264 @@
+import random
+
+import pytest
+
+from graphs.___archive.list_basic_graph_implementation import WeightedGraph
+from graphs.representation.csr_graph import CSRGraph
+from graphs.shortest_path.dijkstra import dijkstra
+
+
+def random_graph(vertices, edges, directed, seed=0, low=1, high=20):
+    rng = random.Random(seed)
+    graph = WeightedGraph(directed=directed)
+    for vertex in range(vertices):
+        graph.add_vertex(vertex)
+    for _ in range(edges):
+        vertex1, vertex2 = rng.randrange(vertices), rng.randrange(vertices)
+        if vertex1 != vertex2:
+            graph.add_edge(vertex1, vertex2, rng.randint(low, high))
+    return graph
+
+
+@pytest.mark.parametrize('to_csr', [False, True])
+def test_dijkstra_unknown_source_reaches_nothing(to_csr):
+    graph = random_graph(10, 30, directed=True)
+    if to_csr:
+        graph = CSRGraph.from_graph(graph)
+    distances, predecessors = dijkstra(graph, 'missing')
+    assert distances['missing'] == 0
+    assert all(distances[vertex] == float('inf') for vertex in graph.graph)
+    assert all(predecessor is None for predecessor in predecessors.values())
+
+
+@pytest.mark.parametrize('directed', [False, True])
+def test_bidirectional_shortest_path_matches_dijkstra(directed):
+    from graphs.shortest_path.basic import shortest_path
+
+    graph = random_graph(40, 120, directed=directed, seed=3)
+    reverse = graph.transpose()
+    # a reverse passed in must be used instead of transposing per query
+    graph.transpose = None
+    for source in range(0, 40, 7):
+        distances, _ = dijkstra(graph, source)
+        for target in range(40):
+            path, distance = shortest_path(graph, source, target, bidirectional=True, reverse=reverse)
+            assert distance == distances[target]
+            if path is not None:
+                assert path[0] == source and path[-1] == target
+                assert sum(graph.get_weight(u, v) for u, v in zip(path, path[1:])) == distance
+
+
+@pytest.mark.parametrize('directed', [False, True])
+def test_contraction_hierarchy_matches_dijkstra(directed, tmp_path):
+    from graphs.shortest_path.contraction_hierarchies import ContractionHierarchy
+
+    graph = random_graph(40, 120, directed=directed, seed=5)
+    hierarchy = ContractionHierarchy(graph)
+    hierarchy.save(tmp_path / 'graph.ch.json')
+    loaded = ContractionHierarchy.load(tmp_path / 'graph.ch.json')
+    for source in range(0, 40, 9):
+        distances, _ = dijkstra(graph, source)
+        for target in range(40):
+            for ch in (hierarchy, loaded):
+                path, distance = ch.query(source, target)
+                assert distance == distances[target]
+                if path is not None:
+                    assert sum(graph.get_weight(u, v) for u, v in zip(path, path[1:])) == distance
+
+
+def test_contraction_hierarchy_save_rejects_unstorable_labels(tmp_path):
+    from graphs.shortest_path.contraction_hierarchies import ContractionHierarchy
+
+    graph = WeightedGraph()
+    graph.add_edge((0, 0), (0, 1), 1)
+    path = tmp_path / 'grid.ch.json'
+    with pytest.raises(TypeError):
+        ContractionHierarchy(graph).save(path)
+    assert not path.exists()
+
+
+def test_floyd_warshall_rejects_negative_self_loop():
+    from graphs.shortest_path.bellman_ford import spfa
+    from graphs.shortest_path.floyd_warshall import floyd_warshall
+
+    graph = WeightedGraph(directed=True)
+    graph.add_edge('a', 'b', 2)
+    graph.add_edge('b', 'b', -1)
+    assert floyd_warshall(graph) == (None, None)
+    assert spfa(graph, 'a')[2] == ['b', 'b']
+
+    graph = WeightedGraph(directed=True)
+    graph.add_edge('a', 'a', 3)
+    graph.add_edge('a', 'b', 2)
+    distances, predecessors = floyd_warshall(graph)
+    assert distances['a'] == {'a': 0, 'b': 2}
+    assert 'a' not in predecessors['a']
+
+
+def test_floyd_warshall_numpy_agrees_on_negative_self_loop():
+    pytest.importorskip('numpy')
+    from graphs.shortest_path.floyd_warshall import floyd_warshall_numpy
+
+    graph = WeightedGraph(directed=True)
+    graph.add_edge('a', 'b', 2)
+    graph.add_edge('b', 'b', -1)
+    assert floyd_warshall_numpy(graph)[1:] == (None, None)
+
+
+@pytest.mark.parametrize('to_csr', [False, True])
+@pytest.mark.parametrize('seed', range(4))
+def test_bellman_ford_vectorized_matches_bellman_ford(to_csr, seed):
+    pytest.importorskip('numpy')
+    from graphs.shortest_path.bellman_ford import bellman_ford, bellman_ford_vectorized, edge_arrays
+
+    # a few negative edges, some seeds close a negative cycle
+    graph = random_graph(30, 70, directed=True, seed=seed, low=-4, high=20)
+    if to_csr:
+        graph = CSRGraph.from_graph(graph)
+    edges = edge_arrays(graph)
+    for source in (0, 11, 29):
+        expected = bellman_ford(graph, source)
+        for actual in (bellman_ford_vectorized(graph, source), bellman_ford_vectorized(graph, source, edges)):
+            assert actual[2] == expected[2]
+            if not expected[2]:
+                assert actual[0] == expected[0]
+                for vertex, predecessor in actual[1].items():
+                    if predecessor is not None:
+                        assert actual[0][vertex] == actual[0][predecessor] + graph.get_weight(predecessor, vertex)
+
+
+def test_bellman_ford_vectorized_unknown_source():
+    pytest.importorskip('numpy')
+    from graphs.shortest_path.bellman_ford import bellman_ford_vectorized, edge_arrays
+
+    graph = random_graph(10, 20, directed=True)
+    edges = edge_arrays(graph)
+    assert bellman_ford_vectorized(graph, 'missing') == (None, None, False)
+    # edges built before the vertex existed don't know it either
+    graph.add_vertex('late')
+    assert bellman_ford_vectorized(graph, 'late', edges) == (None, None, False)
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_johnson_on_edgeless_graph(processes, weighted, monkeypatch, tmp_path):
+    from array import array
+
+    from graphs.___archive.list_basic_graph_implementation import UnweightedGraph
+    from graphs.shortest_path import johnson as johnson_module
+
+    monkeypatch.setattr(johnson_module, 'MIN_PARALLEL_VERTICES', 2)
+    graph = WeightedGraph(directed=True) if weighted else UnweightedGraph(directed=True)
+    for vertex in 'abc':
+        graph.add_vertex(vertex)
+    expected = {u: {v: 0.0 if u == v else float('inf') for v in 'abc'} for u in 'abc'}
+    assert dict(johnson_module.johnson(graph, processes)) == expected
+
+    labels = johnson_module.johnson_to_file(graph, tmp_path / 'distances', processes)
+    matrix = array('d', (tmp_path / 'distances').read_bytes())
+    assert matrix.tolist() == [expected[u][v] for u in labels for v in labels]
+
+
+def test_johnson_on_unweighted_graph_counts_hops():
+    from graphs.___archive.list_basic_graph_implementation import UnweightedGraph
+    from graphs.shortest_path.johnson import johnson
+
+    graph = UnweightedGraph(directed=True)
+    graph.add_edge('a', 'b')
+    graph.add_edge('b', 'c')
+    distances = dict(johnson(graph, processes=1))
+    assert distances['a'] == {'a': 0.0, 'b': 1.0, 'c': 2.0}
+    assert distances['c'] == {'a': float('inf'), 'b': float('inf'), 'c': 0.0}
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_johnson_matches_floyd_warshall(processes, monkeypatch):
+    from graphs.shortest_path import johnson as johnson_module
+    from graphs.shortest_path.floyd_warshall import floyd_warshall
+
+    monkeypatch.setattr(johnson_module, 'MIN_PARALLEL_VERTICES', 2)
+    # seed 1 has negative edges but no negative cycle
+    graph = random_graph(25, 60, directed=True, seed=1, low=-4, high=20)
+    expected, _ = floyd_warshall(graph)
+    assert dict(johnson_module.johnson(graph, processes)) == expected
+
+
+@pytest.mark.parametrize('directed', [False, True])
+def test_csr_dijkstra_matches_list_graph(directed):
+    graph = random_graph(50, 150, directed=directed, seed=7)
+    csr = CSRGraph.from_graph(graph)
+    for source in range(0, 50, 6):
+        assert dijkstra(csr, source)[0] == dijkstra(graph, source)[0]
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'float32'])
+@pytest.mark.parametrize('block_size', [None, 1, 4, 7])
+def test_floyd_warshall_numpy_matches_floyd_warshall(dtype, block_size):
+    np = pytest.importorskip('numpy')
+    from graphs.shortest_path.floyd_warshall import (
+        floyd_warshall, floyd_warshall_numpy, get_shortest_path_floyd_warshall)
+
+    graph = random_graph(30, 80, directed=True, seed=1, low=-4, high=20)
+    expected, expected_hops = floyd_warshall(graph)
+    labels, distances, next_hops = floyd_warshall_numpy(graph, dtype=getattr(np, dtype),
+                                                        block_size=block_size)
+    assert distances.dtype == getattr(np, dtype)
+    for i, u in enumerate(labels):
+        for j, v in enumerate(labels):
+            assert distances[i, j] == expected[u][v]
+            if u == v:
+                # floyd_warshall() keeps no predecessors[u][u]
+                continue
+            path = get_shortest_path_floyd_warshall(next_hops, u, v)
+            assert (path is None) == (get_shortest_path_floyd_warshall(expected_hops, u, v) is None)
+            if path is not None:
+                assert sum(graph.get_weight(a, b) for a, b in zip(path, path[1:])) == expected[u][v]
+
+
+def test_a_star_with_landmarks_matches_dijkstra():
+    from graphs.shortest_path.a_star import LandmarkIndex, a_star
+
+    graph = random_graph(40, 120, directed=True, seed=9)
+    landmarks = LandmarkIndex(graph, num_landmarks=4)
+    for source in range(0, 40, 8):
+        distances, _ = dijkstra(graph, source)
+        for target in range(40):
+            assert a_star(graph, source, target)[1] == distances[target]
+            assert a_star(graph, source, target, landmarks.heuristic)[1] == distances[target]
+
+
+def test_shortest_path_cache_matches_dijkstra_and_follows_changes():
+    from graphs.shortest_path.cache import ShortestPathCache
+
+    graph = random_graph(30, 90, directed=True, seed=4)
+    cache = ShortestPathCache(graph, maxsize=2)
+    for source in (0, 1, 0, 2, 0):
+        assert cache.distances(source) == dijkstra(graph, source)[0]
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (2, 3, 1, 2)
+
+    graph.add_edge(0, 29, 0)
+    assert cache.distance(0, 29) == 0
+    assert cache.path(0, 29) == ([0, 29], 0)
+    assert cache.cache_info().invalidations == 2
+
+
+@pytest.mark.parametrize('directed', [False, True])
+@pytest.mark.parametrize('seed', range(12))
+def test_spfa_negative_cycles_are_real(directed, seed):
+    from graphs.shortest_path.bellman_ford import bellman_ford, spfa
+
+    graph = random_graph(25, 50, directed=directed, seed=seed, low=-6, high=15)
+    for source in (0, 12, 24):
+        distances, predecessors, cycle = spfa(graph, source)
+        if directed:
+            # bellman_ford() relaxes undirected edges one way only, spfa() both ways
+            expected = bellman_ford(graph, source)
+            assert (cycle is not None) == expected[2]
+            if cycle is None:
+                assert distances == expected[0]
+        if cycle is not None:
+            assert len(cycle) >= 2 and cycle[0] == cycle[-1]
+            weights = [graph.get_weight(u, v) for u, v in zip(cycle, cycle[1:])]
+            assert None not in weights
+            assert sum(weights) < 0
@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from graphs.connectivity.strongly_connected import condensation, scc_groups, strongly_connected_components
+from graphs.topological_sort.kahn import kahn_topological_sort
+from graphs.traversal.bfs_list_graph import bfs_level_order
+
+
+def random_digraph(vertices, edges, seed):
+    rng = random.Random(seed)
+    graph = UnweightedGraph(directed=True)
+    for vertex in range(vertices):
+        graph.add_vertex(vertex)
+    for _ in range(edges):
+        vertex1, vertex2 = rng.randrange(vertices), rng.randrange(vertices)
+        if vertex2 not in graph.graph[vertex1]:
+            graph.add_edge(vertex1, vertex2)
+    return graph
+
+
+@pytest.mark.parametrize('vertices, edges', [(30, 25), (30, 45), (40, 120), (1, 1)])
+@pytest.mark.parametrize('seed', range(4))
+def test_scc_matches_mutual_reachability(vertices, edges, seed):
+    graph = random_digraph(vertices, edges, seed)
+    reachable = {vertex: set(bfs_level_order(graph, vertex)) for vertex in graph.graph}
+    labels, component = strongly_connected_components(graph)
+    ids = dict(zip(labels, component))
+    for u in graph.graph:
+        for v in graph.graph:
+            assert (ids[u] == ids[v]) == (v in reachable[u] and u in reachable[v])
+    assert sorted(set(component)) == list(range(len(set(component))))
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_component_ids_follow_topological_order(seed):
+    graph = random_digraph(40, 60, seed)
+    dag, labels, component = condensation(graph)
+    ids = dict(zip(labels, component))
+    for u, v in graph.iter_edges():
+        assert ids[u] <= ids[v]
+    for u, v in dag.iter_edges():
+        assert u < v
+
+    order = kahn_topological_sort(dag)
+    assert sorted(order) == list(range(len(set(component))))
+    groups = scc_groups(graph)
+    assert sorted(map(sorted, groups)) == sorted(
+        sorted(vertex for vertex in graph.graph if ids[vertex] == i) for i in range(len(groups)))
+
+
+def test_scc_on_deep_weighted_cycle():
+    # one cycle longer than the recursion limit, the explicit frames must not overflow
+    graph = WeightedGraph(directed=True)
+    for vertex in range(5000):
+        graph.add_edge(vertex, (vertex + 1) % 5000, 1)
+    graph.add_edge(0, 'tail', 1)
+    groups = scc_groups(graph)
+    assert sorted(map(len, groups)) == [1, 5000]
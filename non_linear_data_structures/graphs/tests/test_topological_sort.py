@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from graphs.topological_sort.kahn import kahn_topological_sort
+
+
+def assert_topological(graph, order):
+    position = {vertex: i for i, vertex in enumerate(order)}
+    assert sorted(position, key=str) == sorted(graph.graph, key=str)
+    for vertex1, vertex2 in graph.iter_edges():
+        assert position[vertex1] < position[vertex2]
+
+
+def test_kahn_on_transposed_view():
+    graph = UnweightedGraph(directed=True, track_incoming=True)
+    for vertex1, vertex2 in [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'd')]:
+        graph.add_edge(vertex1, vertex2)
+    reverse = graph.transpose()
+    assert reverse.in_degrees() == {'a': 2, 'b': 1, 'c': 1, 'd': 0}
+    order = kahn_topological_sort(reverse)
+    assert order[0] == 'd' and order[-1] == 'a'
+    assert_topological(graph, order[::-1])
+
+
+def test_kahn_on_weighted_transposed_view():
+    graph = WeightedGraph(directed=True, track_incoming=True)
+    graph.add_edge('a', 'b', 2)
+    graph.add_edge('b', 'c', 3)
+    assert kahn_topological_sort(graph.transpose()) == ['c', 'b', 'a']
+
+
+def test_kahn_without_in_degrees():
+    class Adjacency:
+        directed = True
+        graph = {'a': ['b'], 'b': ['c'], 'c': []}
+
+    assert kahn_topological_sort(Adjacency()) == ['a', 'b', 'c']
+
+
+def test_reachability_index_on_tuple_labels():
+    from graphs.topological_sort.reachability import ReachabilityIndex
+
+    graph = UnweightedGraph(directed=True)
+    for i in range(3):
+        for j in range(3):
+            if i + 1 < 3:
+                graph.add_edge((i, j), (i + 1, j))
+            if j + 1 < 3:
+                graph.add_edge((i, j), (i, j + 1))
+    for memory_budget in (None, 0):
+        index = ReachabilityIndex(graph, memory_budget=memory_budget)
+        assert index.reachable((0, 0), (2, 2))
+        assert index.reachable((0, 1), (1, 2))
+        assert not index.reachable((1, 1), (0, 2))
+        assert not index.reachable((2, 0), (0, 0))
+
+
+def test_reachability_index_on_weighted_graph():
+    from graphs.topological_sort.reachability import ReachabilityIndex
+
+    graph = WeightedGraph(directed=True)
+    graph.add_edge('a', 'b', 4)
+    graph.add_edge('b', 'c', 1)
+    graph.add_vertex('d')
+    index = ReachabilityIndex(graph)
+    assert index.reachable('a', 'c')
+    assert not index.reachable('c', 'a') and not index.reachable('a', 'd')
+
+
+def random_dag(vertices, edges, seed):
+    # edges only go from lower to higher labels, after shuffling the ids
+    rng = random.Random(seed)
+    order = list(range(vertices))
+    rng.shuffle(order)
+    graph = UnweightedGraph(directed=True)
+    for vertex in order:
+        graph.add_vertex(vertex)
+    for _ in range(edges):
+        vertex1, vertex2 = sorted(rng.sample(range(vertices), 2))
+        if vertex2 not in graph.graph[vertex1]:
+            graph.add_edge(vertex1, vertex2)
+    return graph
+
+
+# None: full closure, 16000: one 64 id chunk at a time, 25000: wider chunks, 0: search only
+@pytest.mark.parametrize('memory_budget', [None, 16000, 25000, 0])
+def test_reachability_index_matches_bfs_under_budget(memory_budget):
+    from graphs.topological_sort.reachability import ReachabilityIndex
+    from graphs.traversal.bfs_list_graph import bfs_level_order
+
+    graph = random_dag(400, 900, seed=3)
+    index = ReachabilityIndex(graph, memory_budget=memory_budget)
+    if memory_budget:
+        assert index.closure is None and index.chunk_bits >= 64
+        assert index.nbytes() == 0
+    rng = random.Random(5)
+    pairs = [(rng.randrange(400), rng.randrange(400)) for _ in range(3000)]
+    expected = [target in bfs_level_order(graph, source) for source, target in pairs]
+    assert index.reachable_many(pairs) == expected
+    assert [index.reachable(source, target) for source, target in pairs[:500]] == expected[:500]
+    if memory_budget:
+        assert 0 < index.nbytes() <= memory_budget
+
+    # new edges keep the answers right, cycles are rejected
+    for vertex1, vertex2 in [(399, 400), (5, 398), (0, 399)]:
+        graph.add_edge(vertex1, vertex2)
+        index.add_edge(vertex1, vertex2)
+    with pytest.raises(ValueError):
+        index.add_edge(400, 0)
+    pairs = [(rng.randrange(401), rng.randrange(401)) for _ in range(1000)]
+    expected = [target in bfs_level_order(graph, source) for source, target in pairs]
+    assert index.reachable_many(pairs) == expected
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from graphs.___archive.list_basic_graph_implementation import UnweightedGraph, WeightedGraph
+from graphs.cycle_detection import directed_graph, undirected_graph, universal
+from graphs.topological_sort.basic import topological_sort
+from graphs.traversal.bfs_list_graph import bfs_level_order
+from graphs.traversal.dfs_list_graph import DISCOVER, dfs_events, find_cycle
+
+
+def grid_graph(rows, columns, directed=False):
+    # vertices are (row, column) tuples, edges go right and down
+    graph = UnweightedGraph(directed=directed)
+    for r in range(rows):
+        for c in range(columns):
+            graph.add_vertex((r, c))
+            if r:
+                graph.add_edge((r - 1, c), (r, c))
+            if c:
+                graph.add_edge((r, c - 1), (r, c))
+    return graph
+
+
+def test_dfs_events_on_tuple_labels():
+    graph = grid_graph(3, 4)
+    discovered = [u for event, u, _ in dfs_events(graph, (0, 0)) if event == DISCOVER]
+    assert sorted(discovered) == sorted(graph.graph)
+
+
+def test_cycle_detection_on_tuple_labels():
+    undirected = grid_graph(2, 2)
+    assert undirected_graph.detect_cycle_undirected(undirected)
+    cycle = undirected_graph.find_cycle_path_undirected(undirected)
+    assert cycle[0] == cycle[-1] and len(cycle) == 5
+    assert universal.is_cyclic(undirected, (0, 0))
+
+    dag = grid_graph(3, 3, directed=True)
+    assert not directed_graph.has_cycle_directed(dag)
+    assert directed_graph.cycle_path(dag, (0, 0)) is False
+    assert not universal.is_cyclic(dag, (0, 0))
+    dag.add_edge((2, 2), (0, 0))
+    assert directed_graph.is_cyclic(dag, (0, 0))
+    assert find_cycle(dag)[0] == (0, 0)
+
+
+def test_topological_sort_on_tuple_labels():
+    dag = grid_graph(3, 3, directed=True)
+    order = topological_sort(dag, (1, 1))
+    position = {vertex: i for i, vertex in enumerate(order)}
+    assert len(order) == 9
+    for vertex1, vertex2 in dag.iter_edges():
+        assert position[vertex1] < position[vertex2]
+
+
+def test_dfs_events_drop_weights():
+    graph = WeightedGraph(directed=True)
+    graph.add_edge('a', 'b', 5)
+    graph.add_edge('b', 'a', 1)
+    assert find_cycle(graph) == ['a', 'b', 'a']
+
+
+def test_bidirectional_bfs_on_tuple_labels():
+    from graphs.traversal.bidirectional_bfs import bidirectional_bfs
+
+    for directed in (False, True):
+        graph = grid_graph(4, 5, directed=directed)
+        path, hops = bidirectional_bfs(graph, (0, 0), (3, 4))
+        assert hops == 7 and path[0] == (0, 0) and path[-1] == (3, 4)
+        for vertex1, vertex2 in zip(path, path[1:]):
+            assert vertex2 in graph.graph[vertex1]
+
+
+def test_bidirectional_bfs_on_weighted_graph():
+    from graphs.traversal.bidirectional_bfs import bidirectional_bfs
+
+    graph = WeightedGraph(directed=True)
+    for vertex1, vertex2 in [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'x'), ('x', 'd')]:
+        graph.add_edge(vertex1, vertex2, 7)
+    assert bidirectional_bfs(graph, 'a', 'd') == (['a', 'x', 'd'], 2)
+
+
+def random_graph(vertices, edges, directed, seed=0):
+    rng = random.Random(seed)
+    graph = UnweightedGraph(directed=directed)
+    for vertex in range(vertices):
+        graph.add_vertex(vertex)
+    for _ in range(edges):
+        vertex1, vertex2 = rng.randrange(vertices), rng.randrange(vertices)
+        if vertex1 != vertex2 and vertex2 not in graph.graph[vertex1]:
+            graph.add_edge(vertex1, vertex2)
+    return graph
+
+
+# (alpha, beta): the defaults, bottom-up from the second level on, top-down only
+@pytest.mark.parametrize('alpha, beta', [(14, 24), (10 ** 9, 10 ** 9), (10 ** -9, 24)])
+@pytest.mark.parametrize('directed', [False, True])
+@pytest.mark.parametrize('seed', range(3))
+def test_bfs_direction_optimizing_matches_bfs_level_order(alpha, beta, directed, seed):
+    from graphs.traversal.direction_optimizing_bfs import bfs_direction_optimizing
+
+    graph = random_graph(60, 150, directed, seed)
+    for source in range(0, 60, 13):
+        expected = bfs_level_order(graph, source)
+        assert bfs_direction_optimizing(graph, source, alpha, beta) == expected
+    assert bfs_direction_optimizing(graph, 'missing', alpha, beta) == {}
+
+
+@pytest.mark.parametrize('batch_size', [1, 3, 64])
+@pytest.mark.parametrize('directed', [False, True])
+def test_multi_source_bfs_matches_bfs_level_order(batch_size, directed):
+    from graphs.traversal.multi_source_bfs import multi_source_bfs, multi_source_bfs_distances
+
+    graph = random_graph(50, 90, directed, seed=2)
+    # duplicates and an unknown source, more sources than one batch holds
+    sources = [0, 7, 7, 'missing', 49, 13, 0, 21, 34]
+    expected = [bfs_level_order(graph, source) for source in sources]
+    assert multi_source_bfs(graph, sources, batch_size) == expected
+
+    labels, rows = multi_source_bfs_distances(graph, sources, batch_size)
+    for levels, row in zip(expected, rows):
+        assert {label: hops for label, hops in zip(labels, row) if hops >= 0} == levels
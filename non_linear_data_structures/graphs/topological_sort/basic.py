@@ -1,3 +1,5 @@
+from ..traversal.dfs_list_graph import FINISH, dfs_events
+
 def topological_sort(graph, start_vertex, visited=None, result=None):
     if visited is None:
         visited = set()
@@ -7,17 +9,15 @@ def topological_sort(graph, start_vertex, visited=None, result=None):
     if start_vertex not in graph.graph:
         return []
 
-    visited.add(start_vertex)
-
-    for neighbor in graph.graph[start_vertex]:
-        if neighbor not in visited:
-           topological_sort(graph, neighbor, visited, result)
-
-    # result.insert(0, start_vertex) # This works but is ineffecient as we insert at the start of the list
-    # return result
-    result.append(start_vertex) #jsut append and only reverse the list when the whole graph has been traversed
-
-    if len(result) == len(graph.graph):
-        result.reverse()
+    # a vertex finishes only after everything reachable from it, so reversed
+    # finish order is a topological order. The search starts at start_vertex and
+    # then covers the remaining vertices, so the order is complete for any DAG
+    roots = [start_vertex]
+    roots.extend(graph.graph)
+    for root in roots:
+        for event, vertex, _ in dfs_events(graph, root, visited):
+            if event == FINISH:
+                result.append(vertex) #jsut append and only reverse the list when the whole graph has been traversed
 
+    result.reverse()
     return result
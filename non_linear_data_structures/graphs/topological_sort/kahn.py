@@ -1,11 +1,19 @@
 from collections import deque
 
+from ..___archive.list_basic_graph_implementation import iter_neighbors
+
 def kahn_topological_sort(graph):
-    # calculating the indegree of each node
-    in_degree = {vertex:0 for vertex in graph.graph}
-    for vertex in graph.graph:
-        for neighbor in graph.graph[vertex]:
-            in_degree[neighbor] = in_degree.get(neighbor, 0) + 1
+    if getattr(graph, 'interner', None) is not None:
+        return _kahn_interned(graph)
+
+    # indegree of each node, O(V) when the graph keeps an incoming-edge index
+    if hasattr(graph, 'in_degrees'):
+        in_degree = graph.in_degrees()
+    else:
+        in_degree = {vertex: 0 for vertex in graph.graph}
+        for vertex in graph.graph:
+            for neighbor in iter_neighbors(graph, vertex):
+                in_degree[neighbor] += 1
 
     queue = deque([vertex for vertex, degree in in_degree.items() if degree == 0])
 
@@ -15,9 +23,31 @@ def kahn_topological_sort(graph):
         current = queue.popleft()
         result.append(current)
 
-        for neighbor in graph.graph[current]:
+        for neighbor in iter_neighbors(graph, current):
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
                 
     return result
+
+def _kahn_interned(graph):
+    # in-degrees counted straight from the target buffer, queue holds int ids
+    offsets, targets = graph.offsets, graph.targets
+    in_degree = [0] * len(graph.interner)
+    for neighbor in targets:
+        in_degree[neighbor] += 1
+
+    queue = deque([vertex for vertex, degree in enumerate(in_degree) if degree == 0])
+
+    result = []
+
+    while queue:
+        current = queue.popleft()
+        result.append(current)
+
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    return graph.interner.to_labels(result)
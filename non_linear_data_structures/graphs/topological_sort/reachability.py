@@ -0,0 +1,268 @@
+from collections import OrderedDict, deque
+
+from ..___archive.list_basic_graph_implementation import iter_neighbors
+from ..representation.interning import VertexInterner
+
+
+class ReachabilityIndex:
+    """
+    Answers "can u reach v" on a DAG without a traversal per query.
+
+    The transitive closure is built once in reverse topological order: every
+    vertex gets a Python int used as a bitset, bit j set when vertex id j is
+    reachable, and a vertex's set is its own bit OR'ed with its children's
+    sets. A query is then one shift and mask.
+
+    The closure needs about V^2 / 8 bytes. When that exceeds memory_budget the
+    target ids are split into chunks of chunk_bits ids, and the closure is kept
+    for as many chunks as the budget holds: every vertex gets a chunk_bits wide
+    bitset of the targets in the chunk it reaches. A chunk is built on first
+    use with the same reverse topological pass (O(V + E) ORs of chunk_bits
+    bits) and the least recently used one is dropped when the budget is full,
+    so queries are one bit test while their targets' chunks are cached. A
+    miss costs one O(V + E) chunk build, so single queries that jump between
+    chunks should go through reachable_many(), which groups its pairs by chunk
+    and builds each chunk at most once.
+    A source ranked after the target in topological order is rejected in O(1)
+    without touching a chunk.
+
+    Only when the budget can't hold a single 64 id chunk does the index fall
+    back to a DFS per query (pruned to vertices ranked before the target), so
+    then a query is a full O(V + E) traversal in the worst case.
+
+    Build:    O(V + E) bitset ORs of V bits each (per chunk when over budget)
+    Query:    O(1) with the closure or a cached chunk, O(V + E) otherwise
+    Space:    O(V^2 / 8) bytes with the closure, at most memory_budget otherwise
+
+    Example:
+        index = ReachabilityIndex(dag)
+        index.reachable('a', 'c')
+        dag.add_edge('c', 'd'); index.add_edge('c', 'd')
+    """
+
+    def __init__(self, graph, memory_budget=None):
+        """
+        Args:
+            graph: Directed acyclic graph (weighted, unweighted or CSR)
+            memory_budget: Maximum bytes for the closure bitsets, None for no limit
+
+        Raises:
+            ValueError: If the graph is undirected or has a cycle
+        """
+        if not graph.directed:
+            raise ValueError("Reachability index needs a directed acyclic graph")
+        self.memory_budget = memory_budget
+        self.interner = VertexInterner(graph.graph)
+        index = self.interner.index
+        self.children = []
+        for vertex in self.interner.labels:
+            self.children.append([index[neighbor] for neighbor in iter_neighbors(graph, vertex)])
+
+        self.rank = None
+        self._rank_valid = False
+        order = self._topological_order()
+        self.closure = None
+        # chunk id -> per vertex bitsets over that chunk's targets, least recently used first
+        self.chunks = OrderedDict()
+        self.chunk_bits = 0
+        self.max_chunks = 0
+        if self._fits_budget():
+            self._build_closure(order)
+        else:
+            self._size_chunks()
+
+    def _topological_order(self):
+        # Kahn's algorithm on ids, also (re)assigns the ranks
+        in_degree = [0] * len(self.children)
+        for row in self.children:
+            for child in row:
+                in_degree[child] += 1
+        queue = deque(vertex for vertex, degree in enumerate(in_degree) if degree == 0)
+        order = []
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for child in self.children[vertex]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+        if len(order) != len(self.children):
+            raise ValueError("Graph has a cycle, reachability index needs a DAG")
+
+        self.rank = [0] * len(order)
+        for position, vertex in enumerate(order):
+            self.rank[vertex] = position
+        self._rank_valid = True
+        return order
+
+    def _fits_budget(self):
+        if self.memory_budget is None:
+            return True
+        n = len(self.children)
+        # int object header plus n bits, per vertex
+        return n * (n // 8 + 32) <= self.memory_budget
+
+    def _size_chunks(self):
+        # widest chunk (a multiple of 64 ids) that fits the budget, 0 for search mode
+        n = len(self.children)
+        per_vertex = self.memory_budget // max(n, 1) - 32
+        self.chunk_bits = min(per_vertex * 8 // 64 * 64, -(-n // 64) * 64)
+        self.chunks.clear()
+        if self.chunk_bits < 64:
+            self.chunk_bits = self.max_chunks = 0
+        else:
+            self.max_chunks = self.memory_budget // (n * (self.chunk_bits // 8 + 32))
+
+    def _chunk(self, chunk_id):
+        # the closure restricted to targets chunk_id * chunk_bits ..., built on demand
+        bitsets = self.chunks.get(chunk_id)
+        if bitsets is not None:
+            self.chunks.move_to_end(chunk_id)
+            return bitsets
+        if not self._rank_valid:
+            self._topological_order()
+        order = [0] * len(self.rank)
+        for vertex, position in enumerate(self.rank):
+            order[position] = vertex
+
+        first = chunk_id * self.chunk_bits
+        last = first + self.chunk_bits
+        bitsets = [0] * len(order)
+        for vertex in reversed(order):
+            reach = 1 << (vertex - first) if first <= vertex < last else 0
+            for child in self.children[vertex]:
+                reach |= bitsets[child]
+            bitsets[vertex] = reach
+        if len(self.chunks) >= self.max_chunks:
+            self.chunks.popitem(last=False)
+        self.chunks[chunk_id] = bitsets
+        return bitsets
+
+    def _build_closure(self, order):
+        closure = [0] * len(order)
+        for vertex in reversed(order):
+            reach = 1 << vertex
+            for child in self.children[vertex]:
+                reach |= closure[child]
+            closure[vertex] = reach
+        self.closure = closure
+
+    def nbytes(self):
+        """Approximate memory of the closure or cached chunk bitsets (0 in search mode)."""
+        if self.closure is None:
+            return sum(reach.bit_length() // 8 + 32
+                       for bitsets in self.chunks.values() for reach in bitsets)
+        return sum(reach.bit_length() // 8 + 32 for reach in self.closure)
+
+    def reachable(self, source, target):
+        """True when there is a path from source to target (a vertex reaches itself)."""
+        index = self.interner.index
+        if source not in index or target not in index:
+            return False
+        return self._reachable_ids(index[source], index[target])
+
+    def reachable_many(self, pairs):
+        """reachable() for an iterable of (source, target) pairs, as a list of bools."""
+        index = self.interner.index
+        queries = []
+        for source, target in pairs:
+            queries.append((index.get(source), index.get(target)))
+        results = [False] * len(queries)
+        positions = range(len(queries))
+        if self.chunk_bits:
+            # answer chunk by chunk, so each chunk is built at most once
+            positions = sorted(positions, key=lambda i: -1 if queries[i][1] is None
+                               else queries[i][1] // self.chunk_bits)
+        for i in positions:
+            source_id, target_id = queries[i]
+            if source_id is not None and target_id is not None:
+                results[i] = self._reachable_ids(source_id, target_id)
+        return results
+
+    def _reachable_ids(self, source, target):
+        if self.closure is not None:
+            return self.closure[source] >> target & 1 == 1
+        if source == target:
+            return True
+
+        if not self._rank_valid:
+            self._topological_order()
+        rank = self.rank
+        limit = rank[target]
+        if rank[source] > limit:
+            return False
+        if self.chunk_bits:
+            chunk_id, offset = divmod(target, self.chunk_bits)
+            return self._chunk(chunk_id)[source] >> offset & 1 == 1
+        return self._search(source, target)
+
+    def _search(self, source, target):
+        # DFS that never enters vertices ranked after the target (they can't lead back to it)
+        rank = self.rank
+        limit = rank[target]
+        seen = {source}
+        stack = [source]
+        while stack:
+            vertex = stack.pop()
+            for child in self.children[vertex]:
+                if child == target:
+                    return True
+                if child not in seen and rank[child] < limit:
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+    def add_vertex(self, vertex):
+        """Register a new isolated vertex and return its id, O(1)."""
+        if vertex in self.interner:
+            return self.interner.index[vertex]
+        vertex_id = self.interner.intern(vertex)
+        self.children.append([])
+        self.rank.append(len(self.rank))
+        if self.closure is not None:
+            if self._fits_budget():
+                self.closure.append(1 << vertex_id)
+            else:
+                self.closure = None
+                self._size_chunks()
+        elif self.memory_budget is not None:
+            # chunk widths and bitsets are sized for the old vertex count
+            self._size_chunks()
+        return vertex_id
+
+    def add_edge(self, vertex1, vertex2):
+        """
+        Update the index for a new edge vertex1 -> vertex2, call it alongside
+        graph.add_edge(). With the closure every ancestor of vertex1 (including
+        itself) gets vertex2's set OR'ed in: O(V) bitset operations instead of
+        a rebuild. Over budget the cached chunks are dropped and rebuilt on
+        demand, and the ranks are recomputed lazily when needed.
+
+        Raises:
+            ValueError: If the edge would create a cycle (the edge is not added)
+        """
+        source = self.add_vertex(vertex1)
+        target = self.add_vertex(vertex2)
+        if self.closure is not None:
+            creates_cycle = self._reachable_ids(target, source)
+        else:
+            # one pruned DFS is cheaper than building a chunk that is dropped below
+            if not self._rank_valid:
+                self._topological_order()
+            creates_cycle = source == target or (
+                self.rank[target] <= self.rank[source] and self._search(target, source))
+        if creates_cycle:
+            raise ValueError(f"Edge {vertex1!r} -> {vertex2!r} would create a cycle")
+
+        self.children[source].append(target)
+        if self.closure is not None:
+            closure = self.closure
+            added = closure[target]
+            source_bit = 1 << source
+            for vertex, reach in enumerate(closure):
+                if reach & source_bit:
+                    closure[vertex] = reach | added
+        else:
+            self.chunks.clear()
+        if self.rank[source] > self.rank[target]:
+            self._rank_valid = False
@@ -3,6 +3,9 @@ from collections import deque
 def bfs(graph, start_vertex):
     if start_vertex not in graph.graph:
         return []
+    if getattr(graph, 'interner', None) is not None:
+        order, _ = _bfs_interned(graph, start_vertex)
+        return graph.interner.to_labels(order)
 
     visited = set()
     queue = deque([start_vertex])
@@ -23,6 +26,10 @@ def bfs(graph, start_vertex):
 def bfs_level_order(graph, start_vertex):
     if start_vertex not in graph.graph:
         return {}
+    if getattr(graph, 'interner', None) is not None:
+        order, levels = _bfs_interned(graph, start_vertex)
+        labels = graph.interner.labels
+        return {labels[vertex]: levels[vertex] for vertex in order}
 
     levels = {start_vertex: 0}
     queue = deque([start_vertex])
@@ -37,3 +44,22 @@ def bfs_level_order(graph, start_vertex):
                 queue.append(neighbor)
 
     return levels
+
+def _bfs_interned(graph, start_vertex):
+    # same BFS on the int ids of an interned graph (e.g. CSRGraph): the visited
+    # set is the level list itself and the order list doubles as the queue
+    offsets, targets = graph.offsets, graph.targets
+    start = graph.interner.index[start_vertex]
+
+    levels = [-1] * len(graph.interner)
+    levels[start] = 0
+    order = [start]
+
+    for vertex in order:
+        next_level = levels[vertex] + 1
+        for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if levels[neighbor] < 0:
+                levels[neighbor] = next_level
+                order.append(neighbor)
+
+    return order, levels
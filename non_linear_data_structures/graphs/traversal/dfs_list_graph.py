@@ -1,5 +1,15 @@
+from ..___archive.list_basic_graph_implementation import iter_neighbors
+
 # visited set
 # result list
+# dfs_events() event names
+DISCOVER = 'discover'
+FINISH = 'finish'
+TREE_EDGE = 'tree'
+BACK_EDGE = 'back'
+FORWARD_EDGE = 'forward'
+CROSS_EDGE = 'cross'
+
 def dfs_recursive(graph, start_vertex, visited=None):
     if visited is None:
         visited = set()
@@ -7,13 +17,19 @@ def dfs_recursive(graph, start_vertex, visited=None):
     if start_vertex not in graph.graph:
         return []
 
-    visited.add(start_vertex)
-    traversal = [start_vertex]
+    # one shared list instead of extending with every child's list, which copied
+    # O(depth) elements per vertex. Still recursive, so deep graphs hit the
+    # recursion limit, use dfs_events() for those
+    traversal = []
 
-    for neighbor in graph.graph[start_vertex]:
-        if neighbor not in visited:
-            traversal.extend(dfs_recursive(graph, neighbor, visited))
+    def visit(vertex):
+        visited.add(vertex)
+        traversal.append(vertex)
+        for neighbor in graph.graph[vertex]:
+            if neighbor not in visited:
+                visit(neighbor)
 
+    visit(start_vertex)
     return traversal
 
 def dfs_iterative(graph, start_vertex):
@@ -36,19 +52,114 @@ def dfs_iterative(graph, start_vertex):
 
 def dfs_path(graph, start_vertex, end_vertex, path=None, visited=None):
     if path is None:
-        return []
+        path = []
+    if start_vertex not in graph.graph:
+        return None
+
+    # the path is the DFS stack: a vertex is pushed on discover and popped on finish
+    for event, vertex, _ in dfs_events(graph, start_vertex, visited):
+        if event == DISCOVER:
+            path.append(vertex)
+            if vertex == end_vertex:
+                return path
+        elif event == FINISH:
+            path.pop()
+    return None
+
+def dfs_events(graph, start_vertex=None, visited=None):
+    """
+    Lazy iterative DFS that yields what happens as (event, u, v) tuples.
+
+    Events:
+        (DISCOVER, vertex, parent) - vertex is entered (parent is None for a root)
+        (FINISH, vertex, parent) - all of vertex's neighbors are done
+        (TREE_EDGE, u, v) - v is discovered through u
+        (BACK_EDGE, u, v) - v is an ancestor of u still on the stack, closes a cycle
+        (FORWARD_EDGE, u, v) - v is an already finished descendant of u (directed only)
+        (CROSS_EDGE, u, v) - any other edge to a finished vertex (directed only)
+
+    Undirected graphs only report tree and back edges: the edge back to the parent
+    is skipped, and the second sighting of a back edge (from the ancestor's side)
+    is not reported again.
+
+    The explicit stack of neighbor iterators visits vertices in exactly the same
+    order as dfs_recursive() without using Python recursion, and nothing is
+    computed ahead of what the caller consumes, so stopping early is free.
+
+    Time Complexity: O(V + E) for a full run
+    Space Complexity: O(V)
+
+    Args:
+        graph: Weighted or unweighted graph (any object with graph.graph / graph.directed)
+        start_vertex: Root of the search, or None to cover every vertex (DFS forest)
+        visited: Optional set; vertices already in it are never entered and
+            everything discovered is added to it
+
+    Yields:
+        tuple: (event, u, v)
+    """
     if visited is None:
         visited = set()
+    directed = graph.directed
+    discovery = {}
+    finished = set()
+    roots = graph.graph if start_vertex is None else [start_vertex]
+
+    for root in roots:
+        if root in visited or root not in graph.graph:
+            continue
+        visited.add(root)
+        discovery[root] = len(discovery)
+        yield DISCOVER, root, None
+        stack = [(root, None, iter_neighbors(graph, root))]
+
+        while stack:
+            vertex, parent, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    yield TREE_EDGE, vertex, neighbor
+                    visited.add(neighbor)
+                    discovery[neighbor] = len(discovery)
+                    yield DISCOVER, neighbor, vertex
+                    stack.append((neighbor, vertex, iter_neighbors(graph, neighbor)))
+                    break
+
+                on_stack = neighbor in discovery and neighbor not in finished
+                if not directed:
+                    if on_stack and neighbor != parent:
+                        yield BACK_EDGE, vertex, neighbor
+                elif on_stack:
+                    yield BACK_EDGE, vertex, neighbor
+                elif neighbor in discovery and discovery[neighbor] > discovery[vertex]:
+                    yield FORWARD_EDGE, vertex, neighbor
+                else:
+                    yield CROSS_EDGE, vertex, neighbor
+            else:
+                stack.pop()
+                finished.add(vertex)
+                yield FINISH, vertex, parent
 
-    path.append(start_vertex)
-    visited.add(start_vertex)
+def find_cycle(graph, start_vertex=None, visited=None):
+    """
+    First cycle found by dfs_events(), in edge order.
 
-    if start_vertex == end_vertex:
-        return path
+    Args:
+        graph: Directed or undirected graph
+        start_vertex: Only search from this vertex, or None for the whole graph
+        visited: Optional set shared with dfs_events()
 
-    for neighbor in graph.graph[start_vertex]:
-        if neighbor not in visited:
-            new_path = dfs_path(graph, neighbor, end_vertex, path, visited)
-            if new_path:
-                return new_path
+    Returns:
+        list: [v, ..., u, v] closed by the back edge u -> v, or None for no cycle
+    """
+    parent = {}
+    for event, u, v in dfs_events(graph, start_vertex, visited):
+        if event == DISCOVER:
+            parent[u] = v
+        elif event == BACK_EDGE:
+            cycle = [u]
+            while cycle[-1] != v:
+                cycle.append(parent[cycle[-1]])
+            cycle.reverse()
+            cycle.append(v)
+            return cycle
     return None
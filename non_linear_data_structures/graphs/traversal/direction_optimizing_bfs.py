@@ -0,0 +1,84 @@
+from ..representation.csr_graph import as_csr
+
+
+def bfs_direction_optimizing(graph, start_vertex, alpha=14, beta=24):
+    """
+    Direction-optimizing BFS (Beamer et al.) on interned vertex ids.
+
+    Each level is expanded either top-down (scan the out-edges of the frontier)
+    or bottom-up (every unvisited vertex scans its in-edges until it finds a
+    parent in the frontier). Bottom-up wins when the frontier covers a large
+    part of the graph, which is typical for the middle levels of low-diameter
+    graphs, because an unvisited vertex stops at its first frontier parent.
+
+    Switching heuristics:
+        - go bottom-up when the frontier's out-edges exceed 1/alpha of the
+          in-edges of the still unvisited vertices
+        - go back top-down when the frontier holds fewer than V/beta vertices
+
+    Visited and frontier membership are kept in bytearrays indexed by id.
+
+    Time Complexity: O(V + E) per direction used
+    Space Complexity: O(V), plus the transposed CSR for directed graphs
+
+    Args:
+        graph: Any graph (list form, CSRGraph, snapshot), converted to CSR when needed
+        start_vertex: Starting vertex
+        alpha: Top-down -> bottom-up threshold
+        beta: Bottom-up -> top-down threshold
+
+    Returns:
+        dict: Same level map as bfs_level_order(), {vertex: distance in edges}
+    """
+    if start_vertex not in graph.graph:
+        return {}
+
+    csr = as_csr(graph)
+    offsets, targets = csr.offsets, csr.targets
+    incoming = csr.transpose()
+    in_offsets, in_targets = incoming.offsets, incoming.targets
+    n = len(csr.labels)
+    start = csr.index[start_vertex]
+
+    visited = bytearray(n)
+    visited[start] = 1
+    frontier = [start]
+    levels = []
+    # in-edges of unvisited vertices, the work a bottom-up step may have to do
+    unexplored_edges = len(in_targets) - (in_offsets[start + 1] - in_offsets[start])
+    remaining = None
+    bottom_up = False
+
+    while frontier:
+        levels.append(frontier)
+        if bottom_up:
+            bottom_up = len(frontier) >= n / beta
+        else:
+            frontier_edges = sum(offsets[vertex + 1] - offsets[vertex] for vertex in frontier)
+            bottom_up = frontier_edges > unexplored_edges / alpha
+
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray(n)
+            for vertex in frontier:
+                in_frontier[vertex] = 1
+            remaining = [v for v in (range(n) if remaining is None else remaining) if not visited[v]]
+            for vertex in remaining:
+                for parent in in_targets[in_offsets[vertex]:in_offsets[vertex + 1]]:
+                    if in_frontier[parent]:
+                        visited[vertex] = 1
+                        next_frontier.append(vertex)
+                        break
+        else:
+            for vertex in frontier:
+                for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        next_frontier.append(neighbor)
+
+        for vertex in next_frontier:
+            unexplored_edges -= in_offsets[vertex + 1] - in_offsets[vertex]
+        frontier = next_frontier
+
+    labels = csr.labels
+    return {labels[vertex]: level for level, vertices in enumerate(levels) for vertex in vertices}
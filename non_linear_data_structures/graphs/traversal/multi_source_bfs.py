@@ -0,0 +1,104 @@
+from array import array
+
+from ..representation.csr_graph import as_csr
+
+
+def _bfs_batch(csr, batch, visit):
+    """
+    One bit-parallel BFS for up to len(batch) sources at once (MS-BFS).
+
+    Bit i of seen[v] is set once batch[i] has reached v, so every vertex
+    carries the visited state of the whole batch in one int and each edge is
+    scanned once per level for all sources together instead of once per source.
+    visit(vertex, mask, level) gets called for every vertex with the bits of
+    the sources that reach it at that level.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    seen = [0] * len(csr.labels)
+    frontier = {}
+    for bit, source in enumerate(batch):
+        if source is not None:
+            seen[source] |= 1 << bit
+            frontier[source] = frontier.get(source, 0) | 1 << bit
+
+    level = 0
+    while frontier:
+        reached = {}
+        for vertex, mask in frontier.items():
+            visit(vertex, mask, level)
+            for neighbor in targets[offsets[vertex]:offsets[vertex + 1]]:
+                new = mask & ~seen[neighbor]
+                if new:
+                    reached[neighbor] = reached.get(neighbor, 0) | new
+        for vertex, mask in reached.items():
+            seen[vertex] |= mask
+        frontier = reached
+        level += 1
+
+
+def _batches(csr, sources, batch_size):
+    ids = [csr.index.get(source) for source in sources]
+    for start in range(0, len(ids), batch_size):
+        yield start, ids[start:start + batch_size]
+
+
+def multi_source_bfs(graph, sources, batch_size=64):
+    """
+    bfs_level_order() for many start vertices, sharing the traversal work.
+
+    Sources are processed batch_size at a time with one bit per source, so a
+    batch of 64 costs roughly one BFS worth of edge scans per level instead of
+    64 separate traversals. Python ints have no width limit, larger batches
+    work too, they just trade memory per vertex for fewer passes.
+
+    Time Complexity: O(ceil(S / batch_size) * (V + E) * L + output), L = levels
+    Space Complexity: O(V) ints of batch_size bits, plus the output
+
+    Args:
+        graph: Any graph, converted to CSR when it isn't interned already
+        sources: Start vertices (unknown ones get an empty map)
+        batch_size: Sources traversed together
+
+    Returns:
+        list: One {vertex: level} dict per source, equal to bfs_level_order(graph, source)
+    """
+    if not sources:
+        return []
+    csr = as_csr(graph)
+    labels = csr.labels
+    level_maps = [{} for _ in sources]
+
+    for start, batch in _batches(csr, sources, batch_size):
+        def record(vertex, mask, level):
+            label = labels[vertex]
+            while mask:
+                lowest = mask & -mask
+                level_maps[start + lowest.bit_length() - 1][label] = level
+                mask ^= lowest
+
+        _bfs_batch(csr, batch, record)
+
+    return level_maps
+
+
+def multi_source_bfs_distances(graph, sources, batch_size=64):
+    """
+    Like multi_source_bfs() but with compact distance arrays instead of dicts.
+
+    Returns:
+        tuple: (labels, rows) where rows[i] is an array('i') of hop counts from
+            sources[i] indexed like labels, -1 for unreachable vertices
+    """
+    csr = as_csr(graph)
+    rows = [array('i', [-1]) * len(csr.labels) for _ in sources]
+
+    for start, batch in _batches(csr, sources, batch_size):
+        def record(vertex, mask, level):
+            while mask:
+                lowest = mask & -mask
+                rows[start + lowest.bit_length() - 1][vertex] = level
+                mask ^= lowest
+
+        _bfs_batch(csr, batch, record)
+
+    return list(csr.labels), rows